@@ -136,6 +136,7 @@ class AppController(
         self.sideboard_guide_entries: list[dict[str, str]] = []
         self.sideboard_exclusions: list[str] = []
         self.left_mode = self.session_manager.get_left_mode()
+        self._session_state_cache: dict[str, Any] | None = None
 
         self._loading_lock = threading.Lock()
         self.loading_archetypes = False
@@ -44,6 +44,7 @@ class AppControllerProto(Protocol):
     _average_method: str
     _average_hours: int
     left_mode: str
+    _session_state_cache: dict[str, Any] | None
     event_logger: EventLogger
     deck_save_dir: Path
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
@@ -26,6 +26,7 @@ class SettingsMixin(_Base):
         left_collapsed: bool | None = None,
         inspector_collapsed: bool | None = None,
     ) -> None:
+        self._session_state_cache = None
         self.session_manager.save(
             current_format=self.current_format,
             left_mode=self.left_mode,
@@ -37,6 +38,12 @@ class SettingsMixin(_Base):
             inspector_collapsed=inspector_collapsed,
         )
 
+    def get_or_load_session_state(self) -> dict[str, Any]:
+        """Restored session state, computed once and shared by the startup consumers."""
+        if self._session_state_cache is None:
+            self._session_state_cache = self.session_manager.restore_session_state(self.zone_cards)
+        return self._session_state_cache
+
     def get_deck_data_source(self) -> str:
         return self._deck_data_source
 
@@ -2,7 +2,8 @@
 """Benchmark the card metadata caches to understand their load times.
 
 Compares stdlib ``json`` against ``msgspec`` (with and without schemas) so the
-speed improvement from the msgspec migration is clearly visible.
+speed improvement from the msgspec migration is clearly visible. The printings
+index is stored as MessagePack, so only its typed msgspec decoder is timed.
 """
 
 from __future__ import annotations
@@ -75,29 +76,32 @@ def _benchmark(path: Path, iterations: int, label: str) -> None:
     logger.info(f"{label} ({size_mb:.1f} MB)  —  {iterations} iteration(s)")
     logger.info(f"{'='*60}")
 
-    # stdlib json
-    logger.info("--- stdlib json ---")
-    stdlib_times = _benchmark_variant(
-        path,
-        iterations,
-        "stdlib",
-        lambda p: json.loads(p.read_bytes()),
-    )
-    _summarise("stdlib json", stdlib_times)
-
-    # msgspec Any (no schema)
-    logger.info("--- msgspec Any (no schema) ---")
-    msgspec_any_times = _benchmark_variant(
-        path,
-        iterations,
-        "msgspec[Any]",
-        fast_load,
-    )
-    _summarise("msgspec Any", msgspec_any_times)
+    stdlib_times: list[float] = []
+    msgspec_any_times: list[float] = []
+    if path.suffix == ".json":
+        # stdlib json
+        logger.info("--- stdlib json ---")
+        stdlib_times = _benchmark_variant(
+            path,
+            iterations,
+            "stdlib",
+            lambda p: json.loads(p.read_bytes()),
+        )
+        _summarise("stdlib json", stdlib_times)
+
+        # msgspec Any (no schema)
+        logger.info("--- msgspec Any (no schema) ---")
+        msgspec_any_times = _benchmark_variant(
+            path,
+            iterations,
+            "msgspec[Any]",
+            fast_load,
+        )
+        _summarise("msgspec Any", msgspec_any_times)
 
     # msgspec typed (only available for known schemas)
     if path == PRINTING_INDEX_CACHE:
-        logger.info("--- msgspec PrintingIndexPayload (typed schema) ---")
+        logger.info("--- msgspec PrintingIndexPayload (typed msgpack schema) ---")
         typed_times = _benchmark_variant(
             path,
             iterations,
@@ -21,11 +21,6 @@ Split by responsibility into internal modules:
 
 from __future__ import annotations
 
-# ``time`` is re-exported so legacy tests that monkeypatch ``image_service.time``
-# (e.g. ``monkeypatch.setattr(image_service.time, "sleep", ...)``) keep working
-# after the module became a package.
-import time  # noqa: F401
-
 from loguru import logger
 
 from services.image_service.disk_cache import CardImageCache
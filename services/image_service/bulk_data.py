@@ -20,6 +20,8 @@ else:
 class BulkDataMixin(_Base):
     """Bulk data freshness + download handling."""
 
+    __slots__ = ()
+
     def check_bulk_data_exists(self) -> tuple[bool, str]:
         from services.image_service import schemas as _schemas
 
@@ -8,6 +8,7 @@ download.
 from __future__ import annotations
 
 import sqlite3
+import time
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -17,12 +18,14 @@ from services.image_service.schemas import BULK_DATA_URL, UTC
 from utils.atomic_io import atomic_write_stream
 from utils.constants import (
     BULK_DATA_CACHE_FRESHNESS_SECONDS,
+    BULK_DATA_METADATA_RECHECK_SECONDS,
     BYTES_PER_MB,
     SCRYFALL_BULK_STREAM_TIMEOUT_SECONDS,
     SCRYFALL_DOWNLOAD_CHUNK_SIZE,
     SCRYFALL_REQUEST_TIMEOUT_SECONDS,
     SQLITE_CONNECTION_TIMEOUT_SECONDS,
 )
+from utils.json_io import fast_decode
 
 if TYPE_CHECKING:
     from services.image_service.downloader_protocol import BulkImageDownloaderProto
@@ -39,7 +42,7 @@ class BulkMetadataMixin(_Base):
         logger.info("Fetching bulk data metadata from Scryfall...")
         resp = self.session.get(BULK_DATA_URL, timeout=SCRYFALL_REQUEST_TIMEOUT_SECONDS)
         resp.raise_for_status()
-        return resp.json()
+        return fast_decode(resp.content)
 
     def _get_cached_bulk_data_record(self) -> tuple[str | None, str | None]:
         with sqlite3.connect(self.cache.db_path, timeout=SQLITE_CONNECTION_TIMEOUT_SECONDS) as conn:
@@ -50,6 +53,22 @@ class BulkMetadataMixin(_Base):
             return row[0], row[1]
         return None, None
 
+    def _bulk_data_just_written(self) -> bool:
+        """Whether the bulk file was downloaded moments ago and is on record.
+
+        Scryfall refreshes bulk data about daily, so re-fetching the metadata
+        for a file written minutes ago only adds a network round-trip.
+        """
+        from services.image_service import schemas as _schemas
+
+        try:
+            age_seconds = time.time() - _schemas.BULK_DATA_CACHE.stat().st_mtime
+        except OSError:
+            return False
+        if age_seconds >= BULK_DATA_METADATA_RECHECK_SECONDS:
+            return False
+        return self._get_cached_bulk_data_record()[1] is not None
+
     def is_bulk_data_outdated(
         self, max_staleness_seconds: int | None = None
     ) -> tuple[bool, dict[str, Any]]:
@@ -57,6 +76,9 @@ class BulkMetadataMixin(_Base):
         # module are honoured by tests.
         from services.image_service import schemas as _schemas
 
+        if self._bulk_data_just_written():
+            return False, {}
+
         metadata = self._fetch_bulk_metadata()
         download_uri = metadata.get("download_uri")
         updated_at = metadata.get("updated_at")
@@ -73,7 +95,7 @@ class BulkMetadataMixin(_Base):
         # Fallback to age-based check when the vendor metadata lacks timestamps/URIs
         threshold = max_staleness_seconds or BULK_DATA_CACHE_FRESHNESS_SECONDS
         try:
-            age_seconds = datetime.now().timestamp() - _schemas.BULK_DATA_CACHE.stat().st_mtime
+            age_seconds = time.time() - _schemas.BULK_DATA_CACHE.stat().st_mtime
             if age_seconds < threshold:
                 return False, metadata
         except OSError:
@@ -84,6 +106,10 @@ class BulkMetadataMixin(_Base):
     def download_bulk_metadata(self, force: bool = False) -> tuple[bool, str]:
         from services.image_service import schemas as _schemas
 
+        if not force and self._bulk_data_just_written():
+            logger.info("Using cached bulk data (downloaded moments ago)")
+            return True, "Using cached bulk data"
+
         try:
             metadata = self._fetch_bulk_metadata()
         except Exception as exc:
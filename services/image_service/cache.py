@@ -20,6 +20,8 @@ else:
 class ImageCacheMixin(_Base):
     """Download-queue orchestration and UI callback plumbing."""
 
+    __slots__ = ()
+
     def set_image_download_callback(
         self, callback: Callable[[CardImageRequest], None] | None
     ) -> None:
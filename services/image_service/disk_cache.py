@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import os
+import platform
 import sqlite3
 import threading
+import time
 import unicodedata
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -24,6 +30,52 @@ from services.image_service.schemas import (
 from utils.constants import SQLITE_CONNECTION_TIMEOUT_SECONDS
 from utils.perf import timed
 
+# Page cache for each reader connection (negative = KiB; every lookup thread
+# holds its own) and how much of the database file lookups may read through a
+# memory map.
+_SQLITE_CACHE_SIZE_KIB = 16 * 1024
+_SQLITE_MMAP_SIZE_BYTES = 256 * 1024 * 1024
+# Prepared statements kept per reader connection. The lookups themselves
+# are a handful of fixed queries, but each IN-batch width is its own statement.
+_SQLITE_CACHED_STATEMENTS = 256
+# UUIDs bound per ``IN (...)`` lookup; older SQLite builds cap a statement at
+# 999 host parameters.
+_SQLITE_IN_BATCH = 900
+# Resolved stored paths and files known to be on disk are remembered per cache,
+# evicting the least recently used once either memo holds this many entries.
+_PATH_MEMO_LIMIT = 65536
+
+
+def _mmap_supported(db_path: Path) -> bool:
+    """Return False for databases on a WSL Windows-drive mount, where mmap misbehaves."""
+    if "microsoft" not in platform.release().lower():
+        return True
+    parts = db_path.parts
+    return not (len(parts) > 2 and parts[1] == "mnt" and len(parts[2]) == 1)
+
+
+@lru_cache(maxsize=16)
+def _resolve_absolute(path: Path) -> Path:
+    return path.resolve()
+
+
+def _resolve_cached(path: Path) -> Path:
+    """``path.resolve()``, remembered for the few absolute cache locations in use.
+
+    Every :class:`CardImageCache` resolves its directory and database path,
+    and resolving walks the filesystem a component at a time. Relative paths
+    depend on the working directory, so they are resolved afresh.
+    """
+    return _resolve_absolute(path) if path.is_absolute() else path.resolve()
+
+
+def _remember(memo: OrderedDict[str, Any], key: str, value: Any) -> None:
+    """Insert *key* as most recently used, evicting the oldest entry past the limit."""
+    memo[key] = value
+    memo.move_to_end(key)
+    if len(memo) > _PATH_MEMO_LIMIT:
+        memo.popitem(last=False)
+
 
 def _strip_accents(text: str) -> str:
     """Return *text* with combining diacritical marks removed (e.g. ó → o)."""
@@ -39,23 +91,129 @@ class CardImageCache:
         self.cache_dir = Path(cache_dir)
         self.db_path = Path(db_path)
         self._ensure_directories()
-        self.cache_dir = self.cache_dir.resolve()
-        self.db_path = self.db_path.resolve()
+        self.cache_dir = _resolve_cached(self.cache_dir)
+        self.db_path = _resolve_cached(self.db_path)
         self._path_roots = build_path_roots(self.cache_dir)
         self._init_database()
         self._path_cache: dict[tuple[str, str], Path | None] = {}
         self._path_cache_lock: threading.Lock = threading.Lock()
+        self._resolved_paths: OrderedDict[str, Path] = OrderedDict()
+        self._existing_files: OrderedDict[str, None] = OrderedDict()
+        # (name, size) pairs with no "front // back" row, so repeat misses skip
+        # the LIKE queries; cleared whenever a double-faced name is recorded.
+        self._alias_misses: set[tuple[str, str]] = set()
+        self._conn: sqlite3.Connection | None = None
+        self._conn_lock: threading.RLock = threading.RLock()
+        self._readers: dict[int, sqlite3.Connection] = {}
+        self._readers_lock: threading.Lock = threading.Lock()
+        self._downloaded_at: tuple[int, str] = (0, "")
 
     def _ensure_directories(self) -> None:
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # One directory listing tells which size folders already exist, so a
+        # warm cache costs a single scandir instead of a mkdir per size.
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                existing = {entry.name for entry in entries if entry.is_dir()}
+        except FileNotFoundError:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            existing = set()
         for size in IMAGE_SIZES.values():
-            (self.cache_dir / size).mkdir(exist_ok=True)
+            if size not in existing:
+                (self.cache_dir / size).mkdir(exist_ok=True)
 
     def _init_database(self) -> None:
         with sqlite3.connect(self.db_path, timeout=SQLITE_CONNECTION_TIMEOUT_SECONDS) as conn:
+            # WAL lets lookups proceed while downloads insert rows, and with
+            # synchronous=NORMAL on the writer connection a commit no longer
+            # fsyncs.
+            conn.execute("PRAGMA journal_mode=WAL")
+            needs_analyze = (
+                conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_card_name_ci'"
+                ).fetchone()
+                is None
+            )
+            # DDL runs in autocommit mode by default; one explicit transaction
+            # keeps schema setup (and any migration) to a single commit.
+            conn.execute("BEGIN")
             self._create_schema(conn)
             self._ensure_face_index_support(conn)
+            self._create_indexes(conn)
             conn.commit()
+            if needs_analyze:
+                # Gather planner statistics once, when the lookup indexes are
+                # first built, so existing caches pick the expression index.
+                conn.execute("ANALYZE")
+
+    def _open_connection(self, *, read_only: bool) -> sqlite3.Connection:
+        if read_only:
+            conn = sqlite3.connect(
+                f"{self.db_path.as_uri()}?mode=ro",
+                uri=True,
+                timeout=SQLITE_CONNECTION_TIMEOUT_SECONDS,
+                check_same_thread=False,
+                cached_statements=_SQLITE_CACHED_STATEMENTS,
+            )
+            conn.execute(f"PRAGMA cache_size=-{_SQLITE_CACHE_SIZE_KIB}")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            if _mmap_supported(self.db_path):
+                conn.execute(f"PRAGMA mmap_size={_SQLITE_MMAP_SIZE_BYTES}")
+            conn.create_function("strip_accents", 1, _strip_accents, deterministic=True)
+        else:
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=SQLITE_CONNECTION_TIMEOUT_SECONDS,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return the long-lived connection every insert goes through.
+
+        Every downloaded face records a row, so reopening a connection (and
+        fsyncing the commit) per insert dominated the write path. Callers hold
+        ``self._conn_lock``; ``check_same_thread=False`` lets any download
+        worker use it.
+        """
+        conn = self._conn
+        if conn is None:
+            conn = self._open_connection(read_only=False)
+            self._conn = conn
+        return conn
+
+    def _reader_connection(self) -> sqlite3.Connection:
+        """Return the calling thread's long-lived read-only connection.
+
+        Lookups fire per card tile from the UI and image-decode threads while
+        download workers insert rows; with WAL each thread reading through its
+        own connection runs concurrently instead of queueing on one lock.
+        Connections left behind by finished threads are closed when the next
+        reader is opened.
+        """
+        ident = threading.get_ident()
+        conn = self._readers.get(ident)
+        if conn is None:
+            conn = self._open_connection(read_only=True)
+            with self._readers_lock:
+                alive = {thread.ident for thread in threading.enumerate()}
+                stale = [self._readers.pop(key) for key in list(self._readers) if key not in alive]
+                self._readers[ident] = conn
+            for old in stale:
+                old.close()
+        return conn
+
+    def close(self) -> None:
+        """Close the writer and every reader connection."""
+        with self._conn_lock:
+            conn = self._conn
+            self._conn = None
+        with self._readers_lock:
+            readers = list(self._readers.values())
+            self._readers.clear()
+        for open_conn in (conn, *readers):
+            if open_conn is not None:
+                open_conn.close()
 
     def _create_schema(self, conn: sqlite3.Connection) -> None:
         conn.execute("""
@@ -73,12 +231,6 @@ class CardImageCache:
                 PRIMARY KEY (uuid, face_index, image_size)
             )
         """)
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_card_name ON card_images(name)
-        """)
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_set_code ON card_images(set_code)
-        """)
         conn.execute("""
             CREATE TABLE IF NOT EXISTS bulk_data_meta (
                 id INTEGER PRIMARY KEY CHECK (id = 1),
@@ -88,6 +240,30 @@ class CardImageCache:
             )
         """)
 
+    def _create_indexes(self, conn: sqlite3.Connection) -> None:
+        # Built after any migration so the indexes land on the current table
+        # rather than following a renamed legacy one.
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_set_code ON card_images(set_code)
+        """)
+        # Name lookups compare LOWER(name), which a plain index on ``name``
+        # cannot serve; the expression index turns them into a seek.
+        conn.execute("DROP INDEX IF EXISTS idx_card_name")
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_card_name_ci
+            ON card_images(LOWER(name), image_size, face_index)
+        """)
+        # LIKE only uses an index on the bare column with NOCASE collation;
+        # this one serves the left-anchored "front // %" alias pattern.
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_card_name_nocase
+            ON card_images(name COLLATE NOCASE, image_size)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_uuid_size
+            ON card_images(uuid, image_size, face_index)
+        """)
+
     def _ensure_face_index_support(self, conn: sqlite3.Connection) -> None:
         info = conn.execute("PRAGMA table_info(card_images)").fetchall()
         has_face_index = any(column[1] == "face_index" for column in info)
@@ -126,7 +302,49 @@ class CardImageCache:
         conn.execute("DROP TABLE card_images_old")
 
     def _resolve_path(self, stored_path: str) -> Path:
-        return resolve_stored_path(stored_path, self.cache_dir, self._path_roots)
+        with self._path_cache_lock:
+            cached = self._resolved_paths.get(stored_path)
+            if cached is not None:
+                self._resolved_paths.move_to_end(stored_path)
+                return cached
+        resolved = resolve_stored_path(stored_path, self.cache_dir, self._path_roots)
+        # Only remember paths that resolved to a file; a miss may be filled by
+        # a later download recorded under the same stored path.
+        if self._file_exists(resolved):
+            with self._path_cache_lock:
+                _remember(self._resolved_paths, stored_path, resolved)
+        return resolved
+
+    def _file_exists(self, path: Path) -> bool:
+        """``path.exists()``, answered from memory once a path has been seen on disk.
+
+        UI redraws look the same cards up over and over; like ``_path_cache``
+        only positive results are kept, so a file that appears later is still
+        picked up on the next lookup. :meth:`add_image` seeds the memo when its
+        caller reports the file as freshly written; :meth:`forget_file_paths`
+        drops it after files are removed behind the cache's back.
+        """
+        key = os.fspath(path)
+        with self._path_cache_lock:
+            if key in self._existing_files:
+                self._existing_files.move_to_end(key)
+                return True
+        if os.path.exists(key):
+            with self._path_cache_lock:
+                _remember(self._existing_files, key, None)
+            return True
+        return False
+
+    def forget_file_paths(self) -> None:
+        """Forget every remembered path resolution and on-disk file.
+
+        Lookups stat the disk again afterwards, so images deleted outside the
+        app stop being reported as cached.
+        """
+        with self._path_cache_lock:
+            self._path_cache.clear()
+            self._resolved_paths.clear()
+            self._existing_files.clear()
 
     @timed
     def get_image_path(self, card_name: str, size: str = "normal") -> Path | None:
@@ -143,47 +361,44 @@ class CardImageCache:
         return result
 
     def _get_image_path_from_db(self, card_name: str, size: str) -> Path | None:
-        with sqlite3.connect(self.db_path, timeout=SQLITE_CONNECTION_TIMEOUT_SECONDS) as conn:
-            cursor = conn.execute(
-                """
-                SELECT file_path
-                FROM card_images
-                WHERE LOWER(name) = LOWER(?) AND image_size = ?
-                ORDER BY face_index
-                LIMIT 1
-                """,
-                (card_name, size),
-            )
-            row = cursor.fetchone()
-            if row:
-                path = self._resolve_path(row[0])
-                if path.exists():
-                    return path
-
-            alias_path = self._lookup_double_faced_alias(conn, card_name, size)
-            if alias_path:
-                return alias_path
-
-            # Fallback: accent-insensitive lookup for cards like "Lórien Revealed"
-            # stored under their accented Scryfall name but requested without accents
-            # (or vice-versa).  SQLite's LOWER() does not strip combining characters,
-            # so we register a custom scalar and compare normalised forms.
-            conn.create_function("strip_accents", 1, _strip_accents)
-            cursor = conn.execute(
-                """
-                SELECT file_path
-                FROM card_images
-                WHERE strip_accents(name) = ? AND image_size = ?
-                ORDER BY face_index
-                LIMIT 1
-                """,
-                (_strip_accents(card_name), size),
-            )
-            row = cursor.fetchone()
-            if row:
-                path = self._resolve_path(row[0])
-                if path.exists():
-                    return path
+        conn = self._reader_connection()
+        row = conn.execute(
+            """
+            SELECT file_path
+            FROM card_images
+            WHERE LOWER(name) = LOWER(?) AND image_size = ?
+            ORDER BY face_index
+            LIMIT 1
+            """,
+            (card_name, size),
+        ).fetchone()
+        if row:
+            path = self._resolve_path(row[0])
+            if self._file_exists(path):
+                return path
+
+        alias_path = self._lookup_double_faced_alias(conn, card_name, size)
+        if alias_path:
+            return alias_path
+
+        # Fallback: accent-insensitive lookup for cards like "Lórien Revealed"
+        # stored under their accented Scryfall name but requested without accents
+        # (or vice-versa).  SQLite's LOWER() does not strip combining characters,
+        # so the connection registers a custom scalar to compare normalised forms.
+        row = conn.execute(
+            """
+            SELECT file_path
+            FROM card_images
+            WHERE strip_accents(name) = ? AND image_size = ?
+            ORDER BY face_index
+            LIMIT 1
+            """,
+            (_strip_accents(card_name), size),
+        ).fetchone()
+        if row:
+            path = self._resolve_path(row[0])
+            if self._file_exists(path):
+                return path
         return None
 
     def _lookup_double_faced_alias(
@@ -194,27 +409,41 @@ class CardImageCache:
             return None
 
         alias_lower = alias.lower()
-        patterns = (
-            f"{alias_lower} // %",
-            f"% // {alias_lower}",
-        )
-
-        for pattern in patterns:
-            cursor = conn.execute(
-                """
+        if (alias_lower, size) in self._alias_misses:
+            return None
+        # One statement for both patterns. SQLite steps a UNION ALL lazily, so
+        # the unindexable back-face scan only runs when the indexed front-face
+        # branch yields nothing usable.
+        cursor = conn.execute(
+            """
+            SELECT file_path FROM (
+                SELECT file_path
+                FROM card_images
+                WHERE name LIKE ? AND image_size = ?
+                ORDER BY face_index
+                LIMIT 1
+            )
+            UNION ALL
+            SELECT file_path FROM (
                 SELECT file_path
                 FROM card_images
-                WHERE LOWER(name) LIKE ? AND image_size = ?
+                WHERE name LIKE ? AND image_size = ?
                 ORDER BY face_index
                 LIMIT 1
-                """,
-                (pattern, size),
             )
-            row = cursor.fetchone()
-            if row:
-                path = self._resolve_path(row[0])
-                if path.exists():
-                    return path
+            """,
+            (f"{alias_lower} // %", size, f"% // {alias_lower}", size),
+        )
+        matched = False
+        for (file_path,) in cursor:
+            matched = True
+            path = self._resolve_path(file_path)
+            if self._file_exists(path):
+                return path
+        if not matched:
+            # Only a name with no alias rows at all is remembered; a row whose
+            # file is missing may still be satisfied by a later download.
+            self._alias_misses.add((alias_lower, size))
         return None
 
     def get_image_path_for_printing(
@@ -222,26 +451,28 @@ class CardImageCache:
     ) -> Path | None:
         if not set_code:
             return self.get_image_path(card_name, size)
-        with sqlite3.connect(self.db_path, timeout=SQLITE_CONNECTION_TIMEOUT_SECONDS) as conn:
-            cursor = conn.execute(
-                """
-                SELECT file_path
-                FROM card_images
-                WHERE LOWER(name) = LOWER(?) AND LOWER(set_code) = LOWER(?) AND image_size = ?
-                ORDER BY face_index
-                LIMIT 1
-                """,
-                (card_name, set_code, size),
-            )
-            row = cursor.fetchone()
-            if not row:
-                return None
-            return self._resolve_path(row[0])
+        cursor = self._reader_connection().execute(
+            """
+            SELECT file_path
+            FROM card_images
+            WHERE LOWER(name) = LOWER(?) AND LOWER(set_code) = LOWER(?) AND image_size = ?
+            ORDER BY face_index
+            LIMIT 1
+            """,
+            (card_name, set_code, size),
+        )
+        row = cursor.fetchone()
+        if not row:
+            return None
+        return self._resolve_path(row[0])
 
     def get_image_by_uuid(
         self, uuid: str, size: str = "normal", face_index: int | None = 0
     ) -> Path | None:
-        query = "SELECT file_path FROM card_images WHERE uuid = ? AND image_size = ? ORDER BY face_index"
+        query = (
+            "SELECT file_path FROM card_images WHERE uuid = ? AND image_size = ? "
+            "ORDER BY face_index LIMIT 1"
+        )
         params: tuple[object, ...]
         if face_index is None:
             params = (uuid, size)
@@ -249,30 +480,27 @@ class CardImageCache:
             query = "SELECT file_path FROM card_images WHERE uuid = ? AND face_index = ? AND image_size = ?"
             params = (uuid, face_index, size)
 
-        with sqlite3.connect(self.db_path, timeout=SQLITE_CONNECTION_TIMEOUT_SECONDS) as conn:
-            cursor = conn.execute(query, params)
-            row = cursor.fetchone()
-            if row:
-                path = self._resolve_path(row[0])
-                if path.exists():
-                    return path
+        row = self._reader_connection().execute(query, params).fetchone()
+        if row:
+            path = self._resolve_path(row[0])
+            if self._file_exists(path):
+                return path
         return None
 
     def get_image_paths_by_uuid(self, uuid: str, size: str = "normal") -> list[Path]:
-        with sqlite3.connect(self.db_path, timeout=SQLITE_CONNECTION_TIMEOUT_SECONDS) as conn:
-            rows = conn.execute(
-                """
-                SELECT face_index, file_path
-                FROM card_images
-                WHERE uuid = ? AND image_size = ? AND face_index >= 0
-                ORDER BY face_index
-                """,
-                (uuid, size),
-            ).fetchall()
+        cursor = self._reader_connection().execute(
+            """
+            SELECT file_path
+            FROM card_images
+            WHERE uuid = ? AND image_size = ? AND face_index >= 0
+            ORDER BY face_index
+            """,
+            (uuid, size),
+        )
         paths: list[Path] = []
-        for _, file_path in rows:
+        for (file_path,) in cursor:
             path = self._resolve_path(file_path)
-            if path.exists():
+            if self._file_exists(path):
                 paths.append(path)
         return paths
 
@@ -287,49 +515,112 @@ class CardImageCache:
         scryfall_uri: str | None = None,
         artist: str | None = None,
         face_index: int = 0,
+        *,
+        on_disk: bool = False,
     ) -> None:
-        file_path_str = str(Path(file_path).resolve())
+        self.add_images(
+            [
+                {
+                    "uuid": uuid,
+                    "name": name,
+                    "set_code": set_code,
+                    "collector_number": collector_number,
+                    "image_size": image_size,
+                    "file_path": file_path,
+                    "scryfall_uri": scryfall_uri,
+                    "artist": artist,
+                    "face_index": face_index,
+                }
+            ],
+            on_disk=on_disk,
+        )
 
-        with sqlite3.connect(self.db_path, timeout=SQLITE_CONNECTION_TIMEOUT_SECONDS) as conn:
-            conn.execute(
+    def add_images(self, records: Iterable[Mapping[str, Any]], *, on_disk: bool = False) -> None:
+        """Record several images in one transaction.
+
+        Each record carries :meth:`add_image`'s keyword arguments. A bulk
+        download flushes its rows through here in batches, so the writer
+        commits once per batch instead of once per face.
+        """
+        paths: list[str] = []
+        keys: set[tuple[str, str]] = set()
+        double_faced = False
+        rows = []
+        for record in records:
+            # Download paths are already absolute under the resolved cache_dir;
+            # only relative paths need the (syscall-heavy) resolve().
+            file_path_str = os.fspath(record["file_path"])
+            if not os.path.isabs(file_path_str):
+                file_path_str = str(Path(file_path_str).resolve())
+            paths.append(file_path_str)
+            keys.add((record["name"].lower(), record["image_size"]))
+            if "//" in record["name"]:
+                double_faced = True
+            rows.append(
+                (
+                    record["uuid"],
+                    record.get("face_index", 0),
+                    record["name"],
+                    record["set_code"],
+                    record["collector_number"],
+                    record["image_size"],
+                    file_path_str,
+                    record.get("scryfall_uri"),
+                    record.get("artist"),
+                )
+            )
+        if not rows:
+            return
+
+        with self._conn_lock, self._connection() as conn:
+            downloaded_at = self._downloaded_at_stamp()
+            conn.executemany(
                 """
                 INSERT OR REPLACE INTO card_images
                 (uuid, face_index, name, set_code, collector_number, image_size, file_path,
-                 downloaded_at, scryfall_uri, artist)
+                 scryfall_uri, artist, downloaded_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-                (
-                    uuid,
-                    face_index,
-                    name,
-                    set_code,
-                    collector_number,
-                    image_size,
-                    file_path_str,
-                    datetime.now(UTC).isoformat(),
-                    scryfall_uri,
-                    artist,
-                ),
+                [(*row, downloaded_at) for row in rows],
             )
-            conn.commit()
-
-        key = (name.lower(), image_size)
         with self._path_cache_lock:
-            self._path_cache.pop(key, None)
+            if on_disk:
+                # The caller has just written these files; later lookups need
+                # no stat.
+                for path in paths[-_PATH_MEMO_LIMIT:]:
+                    _remember(self._existing_files, path, None)
+            for key in keys:
+                self._path_cache.pop(key, None)
+            if double_faced:
+                self._alias_misses.clear()
+
+    def _downloaded_at_stamp(self) -> str:
+        """Return the ``downloaded_at`` value for a new row, reformatted at most once a second.
+
+        Bulk downloads insert thousands of rows per second; second granularity
+        is plenty for the column. Callers hold ``self._conn_lock``.
+        """
+        now = int(time.time())
+        second, stamp = self._downloaded_at
+        if now != second:
+            stamp = datetime.fromtimestamp(now, UTC).isoformat()
+            self._downloaded_at = (now, stamp)
+        return stamp
 
     def get_cache_stats(self) -> dict[str, Any]:
-        with sqlite3.connect(self.db_path, timeout=SQLITE_CONNECTION_TIMEOUT_SECONDS) as conn:
-            total = conn.execute("SELECT COUNT(DISTINCT uuid) FROM card_images").fetchone()[0]
-            by_size = {}
-            for size in IMAGE_SIZES.values():
-                count = conn.execute(
-                    "SELECT COUNT(*) FROM card_images WHERE image_size = ?", (size,)
-                ).fetchone()[0]
+        conn = self._reader_connection()
+        total = conn.execute("SELECT COUNT(DISTINCT uuid) FROM card_images").fetchone()[0]
+        by_size = dict.fromkeys(IMAGE_SIZES.values(), 0)
+        # One grouped scan instead of a COUNT(*) query per size.
+        for size, count in conn.execute(
+            "SELECT image_size, COUNT(*) FROM card_images GROUP BY image_size"
+        ):
+            if size in by_size:
                 by_size[size] = count
 
-            bulk_meta = conn.execute(
-                "SELECT downloaded_at, total_cards FROM bulk_data_meta WHERE id = 1"
-            ).fetchone()
+        bulk_meta = conn.execute(
+            "SELECT downloaded_at, total_cards FROM bulk_data_meta WHERE id = 1"
+        ).fetchone()
 
         return {
             "unique_cards": total,
@@ -341,5 +632,41 @@ class CardImageCache:
     def is_cached(self, uuid: str, size: str = "normal", face_index: int | None = 0) -> bool:
         return self.get_image_by_uuid(uuid, size, face_index=face_index) is not None
 
+    def get_cached_faces(
+        self, size: str = "normal", uuids: Iterable[str] | None = None
+    ) -> dict[tuple[str, int], Path]:
+        """Return ``(uuid, face_index) -> path`` for every cached face of *size*.
+
+        One query replaces the per-face :meth:`is_cached` round-trips of a bulk
+        download; rows whose file has gone missing are left out so they are
+        fetched again. With *uuids*, only those cards are looked up, in
+        ``IN (...)`` batches that stay under SQLite's host-parameter limit.
+        """
+        conn = self._reader_connection()
+        if uuids is None:
+            rows = conn.execute(
+                "SELECT uuid, face_index, file_path FROM card_images WHERE image_size = ?",
+                (size,),
+            ).fetchall()
+        else:
+            wanted = list(dict.fromkeys(uuids))
+            rows = []
+            for start in range(0, len(wanted), _SQLITE_IN_BATCH):
+                batch = wanted[start : start + _SQLITE_IN_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows.extend(
+                    conn.execute(
+                        "SELECT uuid, face_index, file_path FROM card_images "
+                        f"WHERE image_size = ? AND uuid IN ({placeholders})",
+                        (size, *batch),
+                    )
+                )
+        cached: dict[tuple[str, int], Path] = {}
+        for uuid, face_index, file_path in rows:
+            path = self._resolve_path(file_path)
+            if self._file_exists(path):
+                cached[(uuid, face_index)] = path
+        return cached
+
 
 __all__ = ["CardImageCache", "_strip_accents"]
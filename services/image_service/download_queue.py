@@ -2,24 +2,36 @@
 
 from __future__ import annotations
 
+import random
+import re
 import threading
 import time
-from collections import deque
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, KeysView
 from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 
+import requests
 from loguru import logger
 
 from services.image_service.downloader import BulkImageDownloader
+from services.image_service.rate_limiter import TokenBucket
 from services.image_service.schemas import CardImageRequest
 from utils.constants.timing import (
     IMAGE_DOWNLOAD_INITIAL_BACKOFF_SECONDS,
+    IMAGE_DOWNLOAD_MAX_BACKOFF_SECONDS,
     IMAGE_DOWNLOAD_MAX_RETRIES,
+    IMAGE_DOWNLOAD_MIN_RATE_PER_SECOND,
     IMAGE_DOWNLOAD_QUEUE_IDLE_WAIT_SECONDS,
     IMAGE_DOWNLOAD_QUEUE_STOP_TIMEOUT_SECONDS,
+    IMAGE_DOWNLOAD_RATE_PER_SECOND,
+    IMAGE_DOWNLOAD_RATE_RECOVERY_STEP,
     IMAGE_DOWNLOAD_SLOW_THRESHOLD_SECONDS,
 )
 
+# HTTP error status embedded in a failure message ("404 Client Error: ...").
+_STATUS_RE = re.compile(r"\b([45]\d\d)\b")
+
 
 class CardImageDownloadQueue:
     """Background queue for downloading individual card images."""
@@ -28,19 +40,41 @@ class CardImageDownloadQueue:
     _NOT_FOUND_LOCK = threading.Lock()
     _NOT_FOUND_KEYS: set[tuple[str, str]] = set()
 
+    __slots__ = (
+        "_cache",
+        "_downloader",
+        "_on_downloaded",
+        "_on_failed",
+        "_clock",
+        "_pending",
+        "_inflight_keys",
+        "_inflight_count",
+        "_selected_request",
+        "_stop_event",
+        "_lock",
+        "_condition",
+        "_executor",
+        "_rate_limiter",
+        "_thread",
+    )
+
     def __init__(
         self,
         cache,
         *,
         on_downloaded: Callable[[CardImageRequest], None] | None = None,
         on_failed: Callable[[CardImageRequest, str], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         self._cache = cache
         self._downloader = BulkImageDownloader(cache)
         self._on_downloaded = on_downloaded
         self._on_failed = on_failed
-        self._queue: deque[CardImageRequest] = deque()
-        self._pending_keys: set[tuple[str, str, str, str]] = set()
+        self._clock = clock
+        # Pending requests keyed by queue key, in dispatch order. One mapping
+        # serves as both the FIFO and the membership index, and promoting a
+        # request to the front is an O(1) move instead of a deque scan.
+        self._pending: OrderedDict[tuple[str, str, str, str], CardImageRequest] = OrderedDict()
         self._inflight_keys: set[tuple[str, str, str, str]] = set()
         self._inflight_count = 0
         self._selected_request: CardImageRequest | None = None
@@ -48,6 +82,16 @@ class CardImageDownloadQueue:
         self._lock = threading.Lock()
         self._condition = threading.Condition(self._lock)
         self._executor = ThreadPoolExecutor(max_workers=self._MAX_CONCURRENT_DOWNLOADS)
+        # Shared across workers: a 429 slows every worker's admission rate
+        # instead of each one independently hammering the API after its own
+        # backoff expires.
+        self._rate_limiter = TokenBucket(
+            IMAGE_DOWNLOAD_RATE_PER_SECOND,
+            burst=self._MAX_CONCURRENT_DOWNLOADS,
+            min_rate=IMAGE_DOWNLOAD_MIN_RATE_PER_SECOND,
+            recovery_step=IMAGE_DOWNLOAD_RATE_RECOVERY_STEP,
+            clock=clock,
+        )
         self._thread = threading.Thread(
             target=self._run,
             name="card-image-download-queue",
@@ -55,6 +99,16 @@ class CardImageDownloadQueue:
         )
         self._thread.start()
 
+    @property
+    def _queue(self) -> list[CardImageRequest]:
+        """Pending requests in dispatch order (snapshot for inspection)."""
+        return list(self._pending.values())
+
+    @property
+    def _pending_keys(self) -> KeysView[tuple[str, str, str, str]]:
+        """Live view of the pending queue keys."""
+        return self._pending.keys()
+
     def stop(self, timeout: float = IMAGE_DOWNLOAD_QUEUE_STOP_TIMEOUT_SECONDS) -> None:
         self._stop_event.set()
         with self._condition:
@@ -91,16 +145,11 @@ class CardImageDownloadQueue:
                 return False
             if key in self._inflight_keys:
                 return False
-            if key in self._pending_keys:
-                if prioritize:
-                    self._remove_request_by_key_locked(key)
-                else:
-                    return False
+            if key in self._pending and not prioritize:
+                return False
+            self._pending[key] = request
             if prioritize:
-                self._queue.appendleft(request)
-            else:
-                self._queue.append(request)
-            self._pending_keys.add(key)
+                self._pending.move_to_end(key, last=False)
             self._condition.notify()
         return True
 
@@ -108,14 +157,13 @@ class CardImageDownloadQueue:
         while not self._stop_event.is_set():
             with self._condition:
                 while (
-                    not self._queue or self._inflight_count >= self._MAX_CONCURRENT_DOWNLOADS
+                    not self._pending or self._inflight_count >= self._MAX_CONCURRENT_DOWNLOADS
                 ) and not self._stop_event.is_set():
                     self._condition.wait(timeout=IMAGE_DOWNLOAD_QUEUE_IDLE_WAIT_SECONDS)
                 if self._stop_event.is_set():
                     break
-                request = self._queue.popleft()
-                self._pending_keys.discard(request.queue_key())
-                self._inflight_keys.add(request.queue_key())
+                key, request = self._pending.popitem(last=False)
+                self._inflight_keys.add(key)
                 self._inflight_count += 1
 
             future = self._executor.submit(self._download_request, request)
@@ -145,25 +193,35 @@ class CardImageDownloadQueue:
         if self._is_cached(request):
             return True
         max_retries = IMAGE_DOWNLOAD_MAX_RETRIES
-        backoff_seconds = IMAGE_DOWNLOAD_INITIAL_BACKOFF_SECONDS
         attempt = 0
         while True:
             if self._stop_event.is_set():
                 return False
-            started_at = time.monotonic()
+            admission_delay = self._rate_limiter.reserve()
+            if admission_delay and self._stop_event.wait(admission_delay):
+                return False
+            started_at = self._clock()
+            status: int | None = None
+            retry_after: float | None = None
             try:
                 success, msg = self._downloader.download_card_image_by_name(
                     request.card_name, request.size, set_code=request.set_code
                 )
+            except requests.HTTPError as exc:
+                success = False
+                msg = str(exc)
+                if exc.response is not None:
+                    status = exc.response.status_code
+                    retry_after = self._parse_retry_after(exc.response.headers.get("Retry-After"))
             except Exception as exc:
                 success = False
                 msg = str(exc)
-            if not success and self._is_permanent_failure_message(msg):
+            if not success and self._is_permanent_failure(status, msg):
                 logger.error(f"Card image download failed for {request.card_name}: {msg}")
                 self._add_not_found_key(self._not_found_key(request))
                 self._notify_failed(request, msg)
                 return False
-            elapsed = time.monotonic() - started_at
+            elapsed = self._clock() - started_at
             if success:
                 if elapsed > IMAGE_DOWNLOAD_SLOW_THRESHOLD_SECONDS and not self._is_cached(request):
                     logger.error(
@@ -171,13 +229,18 @@ class CardImageDownloadQueue:
                         f"({elapsed:.2f}s elapsed)."
                     )
                     return False
+                self._rate_limiter.on_success()
                 self._discard_not_found_key(self._not_found_key(request))
                 return True
 
+            if (status if status is not None else self._message_status(msg)) == 429:
+                self._rate_limiter.on_throttled()
+
             if attempt >= max_retries:
                 logger.error(f"Card image download failed for {request.card_name}: {msg}")
                 return False
 
+            backoff_seconds = self._retry_delay(attempt, retry_after)
             attempt += 1
             logger.warning(
                 f"Retrying card image download for {request.card_name} in "
@@ -188,10 +251,60 @@ class CardImageDownloadQueue:
             # backoff schedule.
             if self._stop_event.wait(backoff_seconds):
                 return False
-            backoff_seconds *= 2
 
     @staticmethod
-    def _is_permanent_failure_message(message: str) -> bool:
+    def _retry_delay(attempt: int, retry_after: float | None = None) -> float:
+        """Return the wait before retry number ``attempt + 1``.
+
+        A server-supplied ``Retry-After`` wait wins. Otherwise the delay
+        doubles per attempt up to a cap, with jitter in the upper half of the
+        window so concurrent clients do not retry in lockstep.
+        """
+        if retry_after is not None:
+            return retry_after
+        delay = min(
+            IMAGE_DOWNLOAD_MAX_BACKOFF_SECONDS,
+            IMAGE_DOWNLOAD_INITIAL_BACKOFF_SECONDS * (2**attempt),
+        )
+        return delay * (0.5 + random.random() * 0.5)
+
+    @staticmethod
+    def _parse_retry_after(value: str | None) -> float | None:
+        """Return the wait a ``Retry-After`` header asks for, capped.
+
+        The header is either delta-seconds or an HTTP-date. The result is
+        clamped to ``IMAGE_DOWNLOAD_MAX_BACKOFF_SECONDS`` so a bogus value
+        cannot park a worker for hours; unparseable values yield ``None``.
+        """
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            seconds = float(value)
+        else:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                return None
+            seconds = retry_at.timestamp() - time.time()
+        return min(max(seconds, 0.0), IMAGE_DOWNLOAD_MAX_BACKOFF_SECONDS)
+
+    @classmethod
+    def _is_permanent_failure(cls, status: int | None, message: str) -> bool:
+        """Classify a failed attempt, preferring the HTTP status when known.
+
+        Scryfall lookups raise ``requests.HTTPError`` with the response
+        attached, so the status code decides directly; only failures reported
+        as plain messages fall back to text matching.
+        """
+        if status is not None:
+            return status == 404
+        return cls._is_permanent_failure_message(message)
+
+    @classmethod
+    def _is_permanent_failure_message(cls, message: str) -> bool:
         """Identify failures that won't resolve on retry.
 
         Retrying is wasteful (and on shutdown, blocks for the full backoff
@@ -202,7 +315,7 @@ class CardImageDownloadQueue:
         if not message:
             return False
         lowered = message.lower()
-        if "404" in lowered and "not found" in lowered:
+        if "not found" in lowered and cls._message_status(message) == 404:
             return True
         permanent_markers = (
             "no uuid for",
@@ -217,12 +330,15 @@ class CardImageDownloadQueue:
         )
         return any(marker in lowered for marker in permanent_markers)
 
+    @staticmethod
+    def _message_status(message: str) -> int | None:
+        """Return the HTTP error status quoted in *message*, if any."""
+        match = _STATUS_RE.search(message or "")
+        return int(match.group(1)) if match else None
+
     @staticmethod
     def _not_found_key(request: CardImageRequest) -> tuple[str, str]:
-        return (
-            (request.card_name or "").lower(),
-            (request.set_code or "").lower(),
-        )
+        return request.not_found_key()
 
     @classmethod
     def _add_not_found_key(cls, key: tuple[str, str]) -> None:
@@ -236,6 +352,10 @@ class CardImageDownloadQueue:
 
     @classmethod
     def _is_not_found_key_blocked(cls, key: tuple[str, str]) -> bool:
+        # Almost every session has no not-found printings; skip the lock and
+        # the tuple hash on that path. len() on a set is atomic under the GIL.
+        if not cls._NOT_FOUND_KEYS:
+            return False
         with cls._NOT_FOUND_LOCK:
             return key in cls._NOT_FOUND_KEYS
 
@@ -266,19 +386,10 @@ class CardImageDownloadQueue:
         key = request.queue_key()
         if key in self._inflight_keys:
             return
-        if key in self._pending_keys:
-            self._remove_request_by_key_locked(key)
-        self._queue.appendleft(request)
-        self._pending_keys.add(key)
+        self._pending[key] = request
+        self._pending.move_to_end(key, last=False)
         self._condition.notify()
 
-    def _remove_request_by_key_locked(self, key: tuple[str, str, str, str]) -> None:
-        for request in list(self._queue):
-            if request.queue_key() == key:
-                self._queue.remove(request)
-                self._pending_keys.discard(key)
-                return
-
     def _is_cached(self, request: CardImageRequest) -> bool:
         if not request.card_name:
             return False
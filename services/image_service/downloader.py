@@ -19,24 +19,32 @@ Contains:
 from __future__ import annotations
 
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from services.image_service.bulk_metadata import BulkMetadataMixin
 from services.image_service.disk_cache import CardImageCache
 from services.image_service.image_writer import ImageWriterMixin
-from services.image_service.local_resolver import LocalResolverMixin
+from services.image_service.local_resolver import LocalResolverMixin, load_bulk_card_images
 from services.image_service.schemas import BulkCardImage
-from utils.atomic_io import locked_path
 from utils.constants import (
     SCRYFALL_DOWNLOAD_PROGRESS_INTERVAL,
     SCRYFALL_MAX_DOWNLOAD_WORKERS,
 )
 
+# Futures kept in flight per worker thread during a bulk download; enough to
+# keep every worker busy without materializing one future per card.
+_IN_FLIGHT_PER_WORKER = 4
+# Retries for 502/503/504 responses and dropped connections on a GET.
+_HTTP_RETRIES = 3
+_HTTP_RETRY_BACKOFF_SECONDS = 0.2
+
 
 class BulkImageDownloader(
     BulkMetadataMixin,
@@ -56,6 +64,32 @@ class BulkImageDownloader(
         self.max_workers = max_workers
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "MTGOMetagameCrawler/1.0"})
+        # One keep-alive connection per worker for each Scryfall host (api,
+        # cards and data). Blocking on checkout keeps surplus threads waiting
+        # for a warm connection instead of opening throwaway TLS sessions that
+        # the default 10-slot pool would discard.
+        # Transient CDN gateway errors are retried on the warm connection
+        # rather than failing the card and reconnecting for the next one.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max_workers,
+            pool_block=True,
+            max_retries=Retry(
+                total=_HTTP_RETRIES,
+                backoff_factor=_HTTP_RETRY_BACKOFF_SECONDS,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        # Per-size image directories, joined once per size instead of once per
+        # downloaded face.
+        self._size_dirs: dict[str, Path] = {}
+        # Cache rows buffered during download_all_images, written in batches;
+        # None outside a bulk run, when each image is recorded immediately.
+        self._pending_records: list[dict[str, Any]] | None = None
+        self._pending_records_lock = threading.Lock()
         # Lazily-built name -> [card records with image_uris] map from the
         # locally-cached bulk data. Resolving image URLs locally avoids a
         # blocking Scryfall ``/cards/named`` round-trip per uncached card.
@@ -86,12 +120,14 @@ class BulkImageDownloader(
             }
 
         try:
-            from utils.json_io import fast_load
-
-            with locked_path(_schemas.BULK_DATA_CACHE):
-                cards_data = fast_load(_schemas.BULK_DATA_CACHE)
+            # Only the image-related fields are decoded, and after the first
+            # run they come from the MessagePack projection, not the ~500MB JSON.
+            cards_data = load_bulk_card_images(_schemas.BULK_DATA_CACHE)
+            # A capped run only needs the cache state of its own cards.
+            cached_uuids = None
             if max_cards:
                 cards_data = cards_data[:max_cards]
+                cached_uuids = [card.id for card in cards_data if card.id]
 
             total = len(cards_data)
             completed = 0
@@ -100,36 +136,61 @@ class BulkImageDownloader(
             skipped = 0
 
             logger.info(f"Starting bulk download of {total} cards ({size} size)")
-
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {
-                    executor.submit(self._download_single_image, card, size): card
-                    for card in cards_data
-                }
-
-                for future in as_completed(futures):
-                    completed += 1
-                    try:
-                        success, message = future.result()
-                        if success:
-                            if "Already cached" in message:
-                                skipped += 1
-                            else:
-                                successful += 1
-                        else:
-                            failed += 1
-                            logger.debug(message)
-                    except Exception as exc:
-                        failed += 1
-                        logger.debug(f"Exception in download: {exc}")
-
-                    # Progress callback
-                    if progress_callback and completed % SCRYFALL_DOWNLOAD_PROGRESS_INTERVAL == 0:
-                        progress_callback(
-                            completed,
-                            total,
-                            f"{successful} downloaded, {skipped} cached, {failed} failed",
-                        )
+            cached_faces = self.cache.get_cached_faces(size, cached_uuids)
+
+            # Keep only a small window of futures in flight instead of one per
+            # card up front; 100k+ pending futures cost hundreds of MB and a
+            # huge as_completed wait set.
+            max_in_flight = self.max_workers * _IN_FLIGHT_PER_WORKER
+            cards = iter(cards_data)
+            in_flight: set[Future[tuple[bool, str]]] = set()
+            # Workers buffer their cache rows; they are committed in batches
+            # and whatever is left is flushed once the pool has drained.
+            self._pending_records = []
+            try:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    while True:
+                        for card in cards:
+                            in_flight.add(
+                                executor.submit(
+                                    self._download_single_image, card, size, cached_faces
+                                )
+                            )
+                            if len(in_flight) >= max_in_flight:
+                                break
+                        if not in_flight:
+                            break
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                        for future in done:
+                            completed += 1
+                            try:
+                                success, message = future.result()
+                                if success:
+                                    if "Already cached" in message:
+                                        skipped += 1
+                                    else:
+                                        successful += 1
+                                else:
+                                    failed += 1
+                                    logger.debug(message)
+                            except Exception as exc:
+                                failed += 1
+                                logger.debug(f"Exception in download: {exc}")
+
+                            # Progress callback
+                            if (
+                                progress_callback
+                                and completed % SCRYFALL_DOWNLOAD_PROGRESS_INTERVAL == 0
+                            ):
+                                progress_callback(
+                                    completed,
+                                    total,
+                                    f"{successful} downloaded, {skipped} cached, {failed} failed",
+                                )
+            finally:
+                self._flush_image_records()
+                self._pending_records = None
 
             logger.info(
                 f"Bulk download complete: {successful} downloaded, {skipped} cached, {failed} failed"
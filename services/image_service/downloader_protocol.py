@@ -12,7 +12,8 @@ idiom used elsewhere in the package.
 from __future__ import annotations
 
 import threading
-from typing import Protocol
+from pathlib import Path
+from typing import Any, Protocol
 
 import requests
 
@@ -27,6 +28,10 @@ class BulkImageDownloaderProto(Protocol):
     max_workers: int
     session: requests.Session
 
+    _size_dirs: dict[str, Path]
+    _pending_records: list[dict[str, Any]] | None
+    _pending_records_lock: threading.Lock
+
     _local_image_index: dict[str, list[BulkCardImage]] | None
     _local_image_index_mtime: float | None
     _local_image_index_lock: threading.Lock
@@ -1,18 +1,22 @@
 """Per-face image writing for :class:`BulkImageDownloader`.
 
 Talks only to ``self.cache`` and ``self.session``: layout dispatch, per-face
-fetch + :func:`atomic_write_bytes` + ``cache.add_image``.
+fetch + :func:`atomic_write_stream` + ``cache.add_image``. During a bulk
+download the cache rows are buffered and written in batches.
 """
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
-from utils.atomic_io import atomic_write_bytes
-from utils.constants import SCRYFALL_REQUEST_TIMEOUT_SECONDS
+from utils.atomic_io import atomic_write_stream
+from utils.constants import SCRYFALL_IMAGE_CHUNK_SIZE, SCRYFALL_REQUEST_TIMEOUT_SECONDS
 
 if TYPE_CHECKING:
     from services.image_service.downloader_protocol import BulkImageDownloaderProto
@@ -21,12 +25,19 @@ if TYPE_CHECKING:
 else:
     _Base = object
 
+# Cache rows buffered by a bulk download before they are written in one
+# transaction.
+_RECORD_BATCH = 1000
+
 
 class ImageWriterMixin(_Base):
     """Layout dispatch and per-face image fetch + atomic write + cache record."""
 
     def _download_single_image(
-        self, card: dict[str, Any], size: str = "normal"
+        self,
+        card: dict[str, Any],
+        size: str = "normal",
+        cached_faces: Mapping[tuple[str, int], Path] | None = None,
     ) -> tuple[bool, str]:
         uuid = card.get("id")
         name = card.get("name", "Unknown")
@@ -36,7 +47,7 @@ class ImageWriterMixin(_Base):
 
         card_faces = card.get("card_faces") or []
         if card_faces:
-            return self._download_multi_face_card(card, card_faces, size)
+            return self._download_multi_face_card(card, card_faces, size, cached_faces)
 
         success, message, _ = self._download_face_asset(
             uuid=uuid,
@@ -45,11 +56,16 @@ class ImageWriterMixin(_Base):
             image_uris=card.get("image_uris") or {},
             size=size,
             card=card,
+            cached_faces=cached_faces,
         )
         return success, message
 
     def _download_multi_face_card(
-        self, card: dict[str, Any], faces: list[dict[str, Any]], size: str
+        self,
+        card: dict[str, Any],
+        faces: list[dict[str, Any]],
+        size: str,
+        cached_faces: Mapping[tuple[str, int], Path] | None = None,
     ) -> tuple[bool, str]:
         uuid = card.get("id")
         if not uuid:
@@ -62,21 +78,34 @@ class ImageWriterMixin(_Base):
         # name so future Scryfall layouts with the same shape work without code
         # changes.
         if not any((face.get("image_uris") or {}) for face in faces):
-            return self._download_single_image_multi_face(card, size)
+            return self._download_single_image_multi_face(card, size, cached_faces)
 
-        downloaded = 0
-        front_path: Path | None = None
-        for idx, face in enumerate(faces):
-            face_name = face.get("name") or card.get("name", "Unknown")
-            image_uris = face.get("image_uris") or {}
-            success, _, file_path = self._download_face_asset(
+        jobs = [
+            partial(
+                self._download_face_asset,
                 uuid=uuid,
                 face_index=idx,
-                name=face_name,
-                image_uris=image_uris,
+                name=face.get("name") or card.get("name", "Unknown"),
+                image_uris=face.get("image_uris") or {},
                 size=size,
                 card=card,
+                cached_faces=cached_faces,
             )
+            for idx, face in enumerate(faces)
+        ]
+        if cached_faces is None and len(jobs) > 1:
+            # A single on-demand card: fetch the faces side by side so the
+            # back face does not wait out the front face's round-trip. Bulk
+            # runs (which pass ``cached_faces``) already keep every worker
+            # busy, so they stay sequential.
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                results = list(executor.map(lambda job: job(), jobs))
+        else:
+            results = [job() for job in jobs]
+
+        downloaded = 0
+        front_path: Path | None = None
+        for idx, (success, _, file_path) in enumerate(results):
             if success:
                 downloaded += 1
                 if idx == 0:
@@ -85,16 +114,18 @@ class ImageWriterMixin(_Base):
         # Store combined display name pointing to the front face
         combined_name = card.get("name")
         if combined_name and front_path:
-            self.cache.add_image(
-                uuid=uuid,
-                name=combined_name,
-                set_code=card.get("set", ""),
-                collector_number=card.get("collector_number", ""),
-                image_size=size,
-                file_path=front_path,
-                scryfall_uri=card.get("scryfall_uri"),
-                artist=card.get("artist"),
-                face_index=-1,
+            self._record_image(
+                {
+                    "uuid": uuid,
+                    "name": combined_name,
+                    "set_code": card.get("set", ""),
+                    "collector_number": card.get("collector_number", ""),
+                    "image_size": size,
+                    "file_path": front_path,
+                    "scryfall_uri": card.get("scryfall_uri"),
+                    "artist": card.get("artist"),
+                    "face_index": -1,
+                }
             )
 
         if downloaded == 0:
@@ -102,7 +133,10 @@ class ImageWriterMixin(_Base):
         return True, f"Downloaded {downloaded} faces for {card.get('name', 'Unknown')}"
 
     def _download_single_image_multi_face(
-        self, card: dict[str, Any], size: str
+        self,
+        card: dict[str, Any],
+        size: str,
+        cached_faces: Mapping[tuple[str, int], Path] | None = None,
     ) -> tuple[bool, str]:
         uuid = card.get("id") or ""
         combined_name = card.get("name", "Unknown")
@@ -115,6 +149,7 @@ class ImageWriterMixin(_Base):
             image_uris=image_uris,
             size=size,
             card=card,
+            cached_faces=cached_faces,
         )
         return success, message
 
@@ -126,8 +161,15 @@ class ImageWriterMixin(_Base):
         image_uris: dict[str, Any],
         size: str,
         card: dict[str, Any],
+        cached_faces: Mapping[tuple[str, int], Path] | None = None,
     ) -> tuple[bool, str, Path | None]:
-        if self.cache.is_cached(uuid, size, face_index=face_index):
+        # Bulk runs pass a snapshot of the faces already on disk so the warm
+        # path is a dict lookup instead of a SQLite query per face.
+        if cached_faces is not None:
+            path = cached_faces.get((uuid, face_index))
+            if path is not None:
+                return True, f"Already cached: {name}", path
+        elif self.cache.is_cached(uuid, size, face_index=face_index):
             path = self.cache.get_image_by_uuid(uuid, size, face_index=face_index)
             return True, f"Already cached: {name}", path
 
@@ -135,36 +177,81 @@ class ImageWriterMixin(_Base):
         if not image_url:
             return False, f"No {size} image for {name}", None
 
+        resp = None
         try:
-            resp = self.session.get(image_url, timeout=SCRYFALL_REQUEST_TIMEOUT_SECONDS)
+            resp = self.session.get(
+                image_url, stream=True, timeout=SCRYFALL_REQUEST_TIMEOUT_SECONDS
+            )
             resp.raise_for_status()
         except Exception as exc:
+            # A streamed response holds its pooled connection until closed;
+            # with a blocking pool, leaking it on an error status would
+            # eventually starve every worker.
+            if resp is not None:
+                resp.close()
             logger.debug(f"Failed to download {name}: {exc}")
             return False, f"Error: {name} - {exc}", None
 
         ext = "png" if size == "png" else "jpg"
         filename = self._build_face_filename(uuid, face_index, ext)
-        file_path = self.cache.cache_dir / size / filename
+        size_dir = self._size_dirs.get(size)
+        if size_dir is None:
+            size_dir = self._size_dirs[size] = self.cache.cache_dir / size
+        file_path = size_dir / filename
 
+        # Stream the body straight into the temp file rather than buffering
+        # ``resp.content`` first; a card image fits in one or two chunks.
         try:
-            atomic_write_bytes(file_path, resp.content)
+            atomic_write_stream(
+                file_path,
+                resp.iter_content(chunk_size=SCRYFALL_IMAGE_CHUNK_SIZE),
+                durable=False,
+            )
         except Exception as exc:
             logger.debug(f"Failed to write image {name}: {exc}")
             return False, f"Error saving image for {name}: {exc}", None
+        finally:
+            resp.close()
 
-        self.cache.add_image(
-            uuid=uuid,
-            name=name,
-            set_code=card.get("set", ""),
-            collector_number=card.get("collector_number", ""),
-            image_size=size,
-            file_path=file_path,
-            scryfall_uri=card.get("scryfall_uri"),
-            artist=card.get("artist"),
-            face_index=face_index,
+        self._record_image(
+            {
+                "uuid": uuid,
+                "name": name,
+                "set_code": card.get("set", ""),
+                "collector_number": card.get("collector_number", ""),
+                "image_size": size,
+                "file_path": file_path,
+                "scryfall_uri": card.get("scryfall_uri"),
+                "artist": card.get("artist"),
+                "face_index": face_index,
+            }
         )
         return True, f"Downloaded: {name}", file_path
 
+    def _record_image(self, record: dict[str, Any]) -> None:
+        """Record a just-written image, buffering it while a bulk run is active."""
+        pending = self._pending_records
+        if pending is None:
+            self.cache.add_images([record], on_disk=True)
+            return
+        with self._pending_records_lock:
+            pending.append(record)
+            if len(pending) < _RECORD_BATCH:
+                return
+            batch = pending[:]
+            pending.clear()
+        self.cache.add_images(batch, on_disk=True)
+
+    def _flush_image_records(self) -> None:
+        """Write any rows a bulk run has buffered."""
+        pending = self._pending_records
+        if not pending:
+            return
+        with self._pending_records_lock:
+            batch = pending[:]
+            pending.clear()
+        self.cache.add_images(batch, on_disk=True)
+
     @staticmethod
     def _build_face_filename(uuid: str, face_index: int, ext: str) -> str:
         if face_index <= 0:
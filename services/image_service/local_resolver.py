@@ -7,16 +7,22 @@ and the Scryfall ``/cards/named`` and ``/cards/search`` API fallbacks.
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import msgspec
 from loguru import logger
 
 from services.image_service.schemas import (
+    BULK_IMAGES_VERSION,
     SCRYFALL_CARD_NAMED_URL,
     SCRYFALL_CARD_SEARCH_URL,
     BulkCardImage,
+    BulkImagesPayload,
+    _bulk_card_images_decoder,
+    _bulk_images_decoder,
 )
-from utils.atomic_io import locked_path
+from utils.atomic_io import atomic_write_msgpack, mapped_read
 from utils.constants import SCRYFALL_REQUEST_TIMEOUT_SECONDS
 
 if TYPE_CHECKING:
@@ -27,6 +33,41 @@ else:
     _Base = object
 
 
+def bulk_images_cache_path(bulk_path: Path) -> Path:
+    """Return the MessagePack projection stored alongside *bulk_path*."""
+    return bulk_path.with_name(f"{bulk_path.stem}_images_v{BULK_IMAGES_VERSION}.msgpack")
+
+
+def load_bulk_card_images(bulk_path: Path) -> list[BulkCardImage]:
+    """Return the image records of the bulk file at *bulk_path*.
+
+    The image fields are projected out of the JSON once per bulk file (keyed
+    by its mtime) and saved as MessagePack next to it; later calls decode that
+    much smaller file instead. Raises if the bulk JSON itself cannot be read.
+    """
+    mtime = bulk_path.stat().st_mtime
+    cache_path = bulk_images_cache_path(bulk_path)
+    try:
+        payload = _bulk_images_decoder.decode(cache_path.read_bytes())
+    except FileNotFoundError:
+        payload = None
+    except (OSError, msgspec.DecodeError) as exc:
+        logger.debug(f"Ignoring unreadable bulk image cache {cache_path}: {exc}")
+        payload = None
+    if payload is not None and payload.bulk_mtime == mtime:
+        return payload.cards
+
+    with mapped_read(bulk_path) as raw:
+        cards = _bulk_card_images_decoder.decode(raw)
+    try:
+        atomic_write_msgpack(
+            cache_path, BulkImagesPayload(bulk_mtime=mtime, cards=cards), durable=False
+        )
+    except Exception as exc:
+        logger.warning(f"Failed to save bulk image cache {cache_path}: {exc}")
+    return cards
+
+
 class LocalResolverMixin(_Base):
     """Local bulk-data image resolution plus Scryfall name/search fallbacks."""
 
@@ -84,7 +125,6 @@ class LocalResolverMixin(_Base):
         """
         from services.image_service import schemas as _schemas
         from services.image_service.printing_index import _collect_face_aliases
-        from services.image_service.schemas import _bulk_card_images_decoder
 
         bulk_path = _schemas.BULK_DATA_CACHE
         if not bulk_path.exists():
@@ -100,9 +140,7 @@ class LocalResolverMixin(_Base):
                 return self._local_image_index
 
             try:
-                with locked_path(bulk_path):
-                    raw = bulk_path.read_bytes()
-                cards = _bulk_card_images_decoder.decode(raw)
+                cards = load_bulk_card_images(bulk_path)
             except Exception as exc:
                 logger.warning(f"Failed to build local image index from bulk data: {exc}")
                 self._local_image_index = {}
@@ -21,6 +21,8 @@ else:
 class PrintingsFetchMixin(_Base):
     """Fetch printings metadata for individual cards on demand."""
 
+    __slots__ = ()
+
     def fetch_printings_by_name_async(self, card_name: str) -> None:
         key = card_name.lower().strip()
         if not key:
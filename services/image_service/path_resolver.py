@@ -14,10 +14,14 @@ Stored ``file_path`` values in the SQLite database may be:
 from __future__ import annotations
 
 import os
+import re
 from pathlib import Path, PureWindowsPath
 
 from loguru import logger
 
+# ``C:\...`` / ``C:/...``: a Windows drive path, which POSIX treats as relative.
+_WINDOWS_DRIVE_RE = re.compile(r"[A-Za-z]:[\\/]")
+
 
 def build_path_roots(cache_dir: Path) -> list[Path]:
     """Return the candidate filesystem roots used to resolve relative paths."""
@@ -43,10 +47,13 @@ def build_path_roots(cache_dir: Path) -> list[Path]:
 
 def resolve_relative_path(relative: Path, roots: list[Path]) -> Path | None:
     """Try to resolve *relative* against any of the configured *roots*."""
+    # Probe with one isfile() per root on plain strings; only a hit pays for
+    # Path construction and resolve() (which follows symlinks via realpath).
+    relative_str = os.fspath(relative)
     for root in roots:
-        candidate = (root / relative).resolve()
-        if candidate.exists():
-            return candidate
+        candidate = os.path.join(root, relative_str)
+        if os.path.isfile(candidate):
+            return Path(candidate).resolve()
     return None
 
 
@@ -73,33 +80,42 @@ def resolve_stored_path(stored_path: str, cache_dir: Path, roots: list[Path]) ->
     last two components remain locatable under the current ``cache_dir``.
     """
     raw = stored_path.strip()
-    path = Path(raw)
-    resolved = normalize_path(path, roots)
-    if resolved.exists():
-        return resolved
+    foreign_drive = os.name != "nt" and _WINDOWS_DRIVE_RE.match(raw) is not None
+    if os.path.isabs(raw):
+        # Common case: an absolute path written by this machine. One stat
+        # answers it; a missing one skips straight to the fallbacks below.
+        if os.path.exists(raw):
+            return Path(raw)
+        resolved = Path(raw)
+    elif foreign_drive:
+        # A Windows drive path never resolves against the local roots.
+        resolved = Path(raw)
+    else:
+        resolved = normalize_path(Path(raw), roots)
+        if os.path.exists(resolved):
+            return resolved
 
     # Normalize backslashes to forward slashes (works on all OSes)
     if "\\" in raw:
-        normalized = raw.replace("\\", "/")
-        path = Path(normalized)
-        normalized_resolved = normalize_path(path, roots)
-        if normalized_resolved.exists():
-            return normalized_resolved
+        if not foreign_drive:
+            normalized_resolved = normalize_path(Path(raw.replace("\\", "/")), roots)
+            if os.path.exists(normalized_resolved):
+                return normalized_resolved
 
         # Interpret as Windows path and convert to current platform
         try:
             win_path = Path(PureWindowsPath(raw))
-            if win_path.exists():
+            if os.path.exists(win_path):
                 return win_path
         except Exception as exc:
             logger.debug("Failed to normalize Windows path '%s': %s", raw, exc)
 
         # Translate Windows drive letters for WSL paths (e.g., C:\ -> /mnt/c/)
-        if os.name != "nt" and len(raw) >= 3 and raw[1] == ":" and raw[2] in ("\\", "/"):
+        if foreign_drive:
             drive = raw[0].lower()
             remainder = raw[3:].replace("\\", "/")
             wsl_path = Path("/mnt") / drive / remainder
-            if wsl_path.exists():
+            if os.path.exists(wsl_path):
                 return wsl_path
 
     # Project may have been renamed (e.g. magic_online_metagame_crawler →
@@ -110,7 +126,7 @@ def resolve_stored_path(stored_path: str, cache_dir: Path, roots: list[Path]) ->
     try:
         raw_path = Path(raw.replace("\\", "/"))
         rebased = cache_dir / raw_path.parts[-2] / raw_path.name
-        if rebased.exists():
+        if os.path.exists(rebased):
             return rebased
     except Exception:
         pass
@@ -8,8 +8,10 @@ Contains:
 
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Callable
 from datetime import datetime
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
 import msgspec
@@ -24,7 +26,7 @@ from services.image_service.schemas import (
     _bulk_cards_decoder,
     _printing_index_decoder,
 )
-from utils.atomic_io import atomic_write_json, locked_path
+from utils.atomic_io import atomic_write_msgpack, mapped_read
 
 if TYPE_CHECKING:
     from services.image_service.protocol import ImageServiceProto
@@ -53,6 +55,8 @@ def _collect_face_aliases(card: dict[str, Any], display_name: str) -> set[str]:
             if face_name:
                 aliases.add(face_name)
 
+    if not aliases:
+        return aliases
     display_key = display_name.strip().lower()
     return {alias for alias in aliases if alias.lower() != display_key}
 
@@ -69,45 +73,48 @@ def build_printing_index(
     "Lightning Bolt" printing list, or the inspector/dropdown would offer that
     adventure card as a Lightning Bolt printing (issue #792).
     """
-    primary_names = {
-        (card.get("name") or "").strip().lower()
-        for card in cards
-        if (card.get("name") or "").strip() and card.get("id")
-    }
-    by_name: dict[str, list[dict[str, Any]]] = {}
-    total_printings = 0
+    # One pass reads and normalizes every name; the struct ``get`` accessors
+    # are Python-level calls, so each card's name is fetched only once.
+    named: list[tuple[str, Any, str, str, str]] = []
+    primary_names: set[str] = set()
     for card in cards:
         name = (card.get("name") or "").strip()
         uuid = card.get("id")
         if not name or not uuid:
             continue
         key = name.lower()
+        named.append((card.get("released_at") or "", card, name, key, uuid))
+        primary_names.add(key)
+
+    # Sorting the cards newest-first once makes every bucket come out in
+    # release order as it is filled. The sort is stable, so ties keep their
+    # bulk-file order exactly as a per-bucket sort would.
+    named.sort(key=itemgetter(0), reverse=True)
+
+    by_name: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+    for released_at, card, name, key, uuid in named:
         entry = {
             "id": uuid,
             "set": (card.get("set") or "").upper(),
             "set_name": card.get("set_name") or "",
             "collector_number": card.get("collector_number") or "",
-            "released_at": card.get("released_at") or "",
+            "released_at": released_at,
             "flavor_text": card.get("flavor_text") or "",
             "artist": card.get("artist") or "",
             "full_art": bool(card.get("full_art")),
         }
-        by_name.setdefault(key, []).append(entry)
+        by_name[key].append(entry)
         for alias in _collect_face_aliases(card, name):
             alias_key = alias.lower()
             if alias_key == key or alias_key in primary_names:
                 continue
-            by_name.setdefault(alias_key, []).append(entry)
-        total_printings += 1
-
-    for entries in by_name.values():
-        entries.sort(key=lambda c: c.get("released_at") or "", reverse=True)
+            by_name[alias_key].append(entry)
 
     stats = {
         "unique_names": len(by_name),
-        "total_printings": total_printings,
+        "total_printings": len(named),
     }
-    return by_name, stats
+    return dict(by_name), stats
 
 
 def _load_printing_index_payload() -> dict[str, Any] | None:
@@ -118,9 +125,8 @@ def _load_printing_index_payload() -> dict[str, Any] | None:
     if not _schemas.PRINTING_INDEX_CACHE.exists():
         return None
     try:
-        with locked_path(_schemas.PRINTING_INDEX_CACHE):
-            raw = _schemas.PRINTING_INDEX_CACHE.read_bytes()
-        payload = _printing_index_decoder.decode(raw)
+        with mapped_read(_schemas.PRINTING_INDEX_CACHE) as raw:
+            payload = _printing_index_decoder.decode(raw)
     except (msgspec.DecodeError, OSError) as exc:
         logger.warning(f"Failed to read printings index cache: {exc}")
         return None
@@ -153,11 +159,13 @@ def ensure_printing_index_cache(force: bool = False) -> dict[str, Any]:
         raise FileNotFoundError("Bulk data cache not found; cannot build printings index")
 
     logger.info("Building card printings index from bulk data…")
-    with locked_path(_schemas.BULK_DATA_CACHE):
-        raw = _schemas.BULK_DATA_CACHE.read_bytes()
-    cards = _bulk_cards_decoder.decode(raw)
+    with mapped_read(_schemas.BULK_DATA_CACHE) as raw:
+        cards = _bulk_cards_decoder.decode(raw)
 
     by_name, stats = build_printing_index(cards)
+    # The decoded bulk cards are no longer needed; release them before the
+    # index is encoded so the two never peak together.
+    del cards
 
     payload = {
         "version": PRINTING_INDEX_VERSION,
@@ -169,7 +177,7 @@ def ensure_printing_index_cache(force: bool = False) -> dict[str, Any]:
     }
 
     try:
-        atomic_write_json(_schemas.PRINTING_INDEX_CACHE, payload, separators=(",", ":"))
+        atomic_write_msgpack(_schemas.PRINTING_INDEX_CACHE, payload, durable=False)
         logger.info(
             "Cached card printings index ({unique_names} names, {total_printings} printings)",
             unique_names=payload["unique_names"],
@@ -203,6 +211,8 @@ __all__ = [
 class PrintingIndexMixin(_Base):
     """Load and track the printing index in the background."""
 
+    __slots__ = ()
+
     def load_printing_index_async(
         self,
         force: bool,
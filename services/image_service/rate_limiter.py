@@ -0,0 +1,61 @@
+"""Token-bucket admission for Scryfall requests issued by the download queue."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    """Thread-safe token bucket with additive-increase/multiplicative-decrease.
+
+    :meth:`reserve` never blocks: it takes a token (letting the balance go
+    negative when none is left) and returns how long the caller must wait
+    before using it, so workers can sleep on their own interruptible event.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        *,
+        min_rate: float,
+        recovery_step: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_rate = rate
+        self._min_rate = min_rate
+        self._recovery_step = recovery_step
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._clock = clock
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds to wait before spending it."""
+        with self._lock:
+            now = self._clock()
+            elapsed = max(0.0, now - self._updated_at)
+            self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+            self._updated_at = now
+            self._tokens -= 1.0
+            if self._tokens >= 0.0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def on_throttled(self) -> None:
+        """Halve the admission rate after the server pushed back."""
+        with self._lock:
+            self._rate = max(self._min_rate, self._rate * 0.5)
+
+    def on_success(self) -> None:
+        """Creep the admission rate back toward its ceiling."""
+        with self._lock:
+            self._rate = min(self._max_rate, self._rate + self._recovery_step)
@@ -9,12 +9,13 @@ Contains:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timezone
 from typing import Any
 
 import msgspec
 import msgspec.json
+import msgspec.msgpack
 
 try:  # Python 3.11+ has UTC
     from datetime import UTC
@@ -30,8 +31,12 @@ BULK_DATA_CACHE = IMAGE_CACHE_DIR / "bulk_data.json"
 # v5: face-name aliases no longer overwrite a real standalone card's printing
 # list (e.g. "Emeritus of Conflict // Lightning Bolt" must not pollute
 # "Lightning Bolt"); bumping forces a rebuild of the cached index (issue #792).
-PRINTING_INDEX_VERSION = 5
-PRINTING_INDEX_CACHE = IMAGE_CACHE_DIR / f"printings_v{PRINTING_INDEX_VERSION}.json"
+# v6: stored as MessagePack instead of JSON (smaller and quicker to decode).
+PRINTING_INDEX_VERSION = 6
+PRINTING_INDEX_CACHE = IMAGE_CACHE_DIR / f"printings_v{PRINTING_INDEX_VERSION}.msgpack"
+# Image-field projection of the bulk file, stored next to it as MessagePack so
+# repeat bulk downloads and local lookups skip re-parsing the ~500MB JSON.
+BULK_IMAGES_VERSION = 1
 
 # Image size options (in order of preference for storage)
 IMAGE_SIZES = {
@@ -127,6 +132,13 @@ class BulkCardImage(msgspec.Struct, gc=False):
             raise KeyError(key) from None
 
 
+class BulkImagesPayload(msgspec.Struct):
+    """Root structure of the saved bulk image projection."""
+
+    bulk_mtime: float
+    cards: list[BulkCardImage]
+
+
 class PrintingEntry(msgspec.Struct, gc=False):
     """A single card printing record stored in the printings index."""
 
@@ -165,27 +177,49 @@ _bulk_cards_decoder: msgspec.json.Decoder[list[BulkCard]] = msgspec.json.Decoder
 _bulk_card_images_decoder: msgspec.json.Decoder[list[BulkCardImage]] = msgspec.json.Decoder(
     list[BulkCardImage]
 )
-_printing_index_decoder: msgspec.json.Decoder[PrintingIndexPayload] = msgspec.json.Decoder(
+_printing_index_decoder: msgspec.msgpack.Decoder[PrintingIndexPayload] = msgspec.msgpack.Decoder(
     PrintingIndexPayload
 )
+_bulk_images_decoder: msgspec.msgpack.Decoder[BulkImagesPayload] = msgspec.msgpack.Decoder(
+    BulkImagesPayload
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CardImageRequest:
-    """Represents a single card image download request."""
+    """Represents a single card image download request.
+
+    The queue and not-found keys are derived once at construction because the
+    download queue consults them on every enqueue, promotion and completion.
+    """
 
     card_name: str
     uuid: str | None
     set_code: str | None
     collector_number: str | None
     size: str = "normal"
+    _queue_key: tuple[str, str, str, str] = field(init=False, repr=False, compare=False)
+    _not_found_key: tuple[str, str] = field(init=False, repr=False, compare=False)
 
-    def queue_key(self) -> tuple[str, str, str, str]:
+    def __post_init__(self) -> None:
         if self.uuid:
-            return ("uuid", self.uuid.lower(), self.size, "")
-        set_code = (self.set_code or "").lower()
-        collector = (self.collector_number or "").lower()
-        return ("set", set_code, collector, self.size)
+            queue_key = ("uuid", self.uuid.lower(), self.size, "")
+        else:
+            set_code = (self.set_code or "").lower()
+            collector = (self.collector_number or "").lower()
+            queue_key = ("set", set_code, collector, self.size)
+        object.__setattr__(self, "_queue_key", queue_key)
+        object.__setattr__(
+            self,
+            "_not_found_key",
+            ((self.card_name or "").lower(), (self.set_code or "").lower()),
+        )
+
+    def queue_key(self) -> tuple[str, str, str, str]:
+        return self._queue_key
+
+    def not_found_key(self) -> tuple[str, str]:
+        return self._not_found_key
 
     def can_fetch(self) -> bool:
         return bool((self.card_name or "").strip())
@@ -194,9 +228,11 @@ class CardImageRequest:
 __all__ = [
     "BULK_DATA_CACHE",
     "BULK_DATA_URL",
+    "BULK_IMAGES_VERSION",
     "BulkCard",
     "BulkCardFace",
     "BulkCardImage",
+    "BulkImagesPayload",
     "CardImageRequest",
     "IMAGE_CACHE_DIR",
     "IMAGE_DB_PATH",
@@ -210,5 +246,6 @@ __all__ = [
     "UTC",
     "_bulk_card_images_decoder",
     "_bulk_cards_decoder",
+    "_bulk_images_decoder",
     "_printing_index_decoder",
 ]
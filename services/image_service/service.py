@@ -24,6 +24,23 @@ class ImageService(
 ):
     """Service for managing card image bulk data and printing indices."""
 
+    # The mixins declare empty ``__slots__`` so instances carry no ``__dict__``.
+    __slots__ = (
+        "image_cache",
+        "image_downloader",
+        "bulk_data_by_name",
+        "printing_index_loading",
+        "_on_image_downloaded",
+        "_on_image_download_failed",
+        "_download_queue",
+        "_printings_lock",
+        "_printings_inflight",
+        "_on_printings_loaded",
+        "_process_worker",
+        "_bulk_download_handle",
+        "_printings_handle",
+    )
+
     def __init__(self):
         self.image_cache = get_cache()
         self.image_downloader: BulkImageDownloader | None = None
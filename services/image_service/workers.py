@@ -16,7 +16,7 @@ from services.image_service.disk_cache import CardImageCache
 from services.image_service.downloader import BulkImageDownloader
 from services.image_service.printing_index import build_printing_index
 from services.image_service.schemas import _bulk_cards_decoder
-from utils.atomic_io import atomic_write_json, locked_path
+from utils.atomic_io import atomic_write_msgpack, mapped_read
 
 __all__ = ["build_printing_index_worker", "download_bulk_metadata_worker"]
 
@@ -42,11 +42,13 @@ def build_printing_index_worker(
     if bulk_mtime is None:
         raise FileNotFoundError("Bulk data cache not found; cannot build printings index")
 
-    with locked_path(bulk_path):
-        raw = bulk_path.read_bytes()
-    cards = _bulk_cards_decoder.decode(raw)
+    with mapped_read(bulk_path) as raw:
+        cards = _bulk_cards_decoder.decode(raw)
 
     by_name, stats = build_printing_index(cards)
+    # The decoded bulk cards are no longer needed; release them before the
+    # index is encoded so the two never peak together.
+    del cards
     payload = {
         "version": printings_version,
         "generated_at": datetime.now(UTC).isoformat(),
@@ -55,7 +57,7 @@ def build_printing_index_worker(
         "total_printings": stats["total_printings"],
         "data": by_name,
     }
-    atomic_write_json(printings_cache, payload, separators=(",", ":"))
+    atomic_write_msgpack(printings_cache, payload, durable=False)
     return {
         "unique_names": payload["unique_names"],
         "total_printings": payload["total_printings"],
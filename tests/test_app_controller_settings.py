@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import Any
+
+from controllers.app_controller.settings import SettingsMixin
+
+
+class _StubSessionManager:
+    def __init__(self) -> None:
+        self.restore_calls = 0
+        self.saves: list[dict[str, Any]] = []
+
+    def restore_session_state(self, zone_cards: dict[str, list[dict[str, Any]]]) -> dict[str, Any]:
+        self.restore_calls += 1
+        return {"left_mode": "research", "restore": self.restore_calls}
+
+    def save(self, **kwargs: Any) -> None:
+        self.saves.append(kwargs)
+
+
+class _Controller(SettingsMixin):
+    def __init__(self) -> None:
+        self.session_manager = _StubSessionManager()
+        self.current_format = "Modern"
+        self.left_mode = "research"
+        self._deck_data_source = "both"
+        self.zone_cards = {"main": [], "side": [], "out": []}
+        self._session_state_cache = None
+
+
+def test_session_state_is_restored_once_until_settings_are_saved():
+    controller = _Controller()
+
+    first = controller.get_or_load_session_state()
+    assert controller.get_or_load_session_state() is first
+    assert controller.session_manager.restore_calls == 1
+
+    controller.save_settings(window_size=(800, 600))
+    assert len(controller.session_manager.saves) == 1
+
+    assert controller.get_or_load_session_state() == {"left_mode": "research", "restore": 2}
+    assert controller.session_manager.restore_calls == 2
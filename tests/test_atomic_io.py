@@ -7,14 +7,17 @@ import os
 import threading
 from pathlib import Path
 
+import msgspec
 import pytest
 
 import utils.atomic_io as atomic_io
 from utils.atomic_io import (
     atomic_write_bytes,
     atomic_write_json,
+    atomic_write_msgpack,
     atomic_write_stream,
     atomic_write_text,
+    mapped_read,
 )
 
 
@@ -79,6 +82,13 @@ def test_atomic_write_json_separators_is_a_noop(tmp_path: Path) -> None:
     assert "\n  " in contents
 
 
+def test_atomic_write_msgpack_roundtrip(tmp_path: Path) -> None:
+    target = tmp_path / "data.msgpack"
+    payload = {"a": 1, "b": ["é", 2.5, None]}
+    atomic_write_msgpack(target, payload)
+    assert msgspec.msgpack.decode(target.read_bytes()) == payload
+
+
 def test_atomic_write_stream_roundtrip(tmp_path: Path) -> None:
     target = tmp_path / "stream.bin"
     atomic_write_stream(target, [b"foo", b"bar", b"baz"])
@@ -158,6 +168,19 @@ def test_replace_reraises_after_exhausting_retries(
     assert list(tmp_path.glob(".data.txt.*.tmp")) == []
 
 
+def test_non_durable_write_skips_fsync(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    synced: list[int] = []
+    monkeypatch.setattr(atomic_io.os, "fsync", synced.append)
+
+    target = tmp_path / "data.bin"
+    atomic_write_bytes(target, b"cache", durable=False)
+    assert target.read_bytes() == b"cache"
+    assert synced == []
+
+    atomic_write_bytes(target, b"durable")
+    assert len(synced) == 2  # temp file and parent directory
+
+
 def test_get_path_lock_is_stable_across_spellings(tmp_path: Path) -> None:
     """Different Path spellings of one file must share a single lock."""
     target = tmp_path / "data.txt"
@@ -168,6 +191,12 @@ def test_get_path_lock_is_stable_across_spellings(tmp_path: Path) -> None:
     assert lock_a is lock_b
 
 
+def test_get_path_lock_draws_from_bounded_pool(tmp_path: Path) -> None:
+    """Locking many distinct paths must not allocate a lock per path."""
+    locks = {id(atomic_io._get_path_lock(tmp_path / f"file-{i}.json")) for i in range(1000)}
+    assert len(locks) <= atomic_io._LOCK_STRIPES
+
+
 def test_locked_path_acquires_and_releases(tmp_path: Path) -> None:
     target = tmp_path / "data.txt"
     target.write_text("x", encoding="utf-8")
@@ -184,6 +213,21 @@ def test_locked_path_acquires_and_releases(tmp_path: Path) -> None:
     lock.release()
 
 
+def test_mapped_read_decodes_from_memory_map(tmp_path: Path) -> None:
+    target = tmp_path / "cards.json"
+    atomic_write_json(target, [{"name": "Island"}])
+    empty = tmp_path / "empty.json"
+    empty.write_bytes(b"")
+
+    with mapped_read(target) as raw:
+        assert msgspec.json.decode(raw) == [{"name": "Island"}]
+    with mapped_read(empty) as raw:
+        assert raw == b""
+    with pytest.raises(FileNotFoundError):
+        with mapped_read(tmp_path / "missing.json"):
+            pass
+
+
 def test_concurrent_writes_to_same_path_are_not_interleaved(tmp_path: Path) -> None:
     """Concurrent writers to one path serialize and never produce a torn file."""
     target = tmp_path / "data.txt"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 
+import msgspec
 import pytest
 
 from services import image_service as card_images
@@ -316,3 +317,19 @@ def test_ensure_printing_index_cache_raises_without_bulk_data(tmp_path, monkeypa
 
     with pytest.raises(FileNotFoundError):
         card_images.ensure_printing_index_cache(force=True)
+
+
+def test_ensure_printing_index_cache_writes_msgpack(tmp_path, monkeypatch):
+    """The machine-only index cache is MessagePack and reloads unchanged."""
+    cache_dir = tmp_path / "card_images"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    printings_path = cache_dir / "printings.msgpack"
+    _write_bulk_payload(cache_dir, monkeypatch, printings_path)
+
+    built = card_images.ensure_printing_index_cache(force=True)
+
+    raw = printings_path.read_bytes()
+    assert msgspec.msgpack.decode(raw)["version"] == card_images.PRINTING_INDEX_VERSION
+    loaded = card_images.load_printing_index_payload()
+    assert loaded is not None
+    assert loaded["data"] == built["data"]
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import os
 import sqlite3
 import sys
 import threading
+import time
 import types
 from datetime import datetime
 from typing import Any
 
+import pytest
+
 
 class _WxStub(types.ModuleType):
     """A permissive ``wx`` stand-in fabricating attributes on demand."""
@@ -92,6 +96,65 @@ def test_card_image_cache_migrates_face_index_column(tmp_path):
     assert migrated_row == ("uuid-old", 0, "Legacy Entry")
 
 
+def test_card_image_cache_name_lookups_use_expression_index(tmp_path):
+    """Case-insensitive name lookups seek an index instead of scanning the table."""
+    cache_dir = tmp_path / "cache"
+    db_path = cache_dir / "images.db"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE card_images (
+                uuid TEXT NOT NULL,
+                name TEXT NOT NULL,
+                set_code TEXT,
+                collector_number TEXT,
+                image_size TEXT NOT NULL,
+                file_path TEXT NOT NULL,
+                downloaded_at TEXT NOT NULL,
+                scryfall_uri TEXT,
+                artist TEXT
+            )
+            """)
+        conn.execute("CREATE INDEX idx_card_name ON card_images(name)")
+
+    card_images.CardImageCache(cache_dir=cache_dir, db_path=db_path)
+
+    with sqlite3.connect(db_path) as conn:
+        indexes = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'card_images'"
+            )
+        }
+        plan = " ".join(
+            row[-1]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT file_path FROM card_images "
+                "WHERE LOWER(name) = LOWER(?) AND image_size = ? ORDER BY face_index LIMIT 1",
+                ("Lightning Bolt", "normal"),
+            )
+        )
+
+        alias_plan = " ".join(
+            row[-1]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT file_path FROM card_images "
+                "WHERE name LIKE ? AND image_size = ? ORDER BY face_index LIMIT 1",
+                ("delver of secrets // %", "normal"),
+            )
+        )
+
+    assert {
+        "idx_card_name_ci",
+        "idx_card_name_nocase",
+        "idx_uuid_size",
+        "idx_set_code",
+    } <= indexes
+    assert "idx_card_name" not in indexes
+    assert "idx_card_name_ci" in plan
+    assert "idx_card_name_nocase" in alias_plan
+
+
 def test_resolves_windows_style_relative_paths(tmp_path):
     """Backslash-separated cache entries should be normalized and resolved."""
     cache_dir = tmp_path / "cache"
@@ -129,12 +192,142 @@ def test_resolves_windows_style_relative_paths(tmp_path):
     assert resolved == expected_path
 
 
+def test_resolved_stored_paths_are_memoized_once_found(tmp_path, monkeypatch):
+    """Stored paths are normalized once; misses are retried on the next lookup."""
+    from services.image_service import disk_cache
+
+    cache = card_images.CardImageCache(
+        cache_dir=tmp_path / "cache", db_path=tmp_path / "cache" / "images.db"
+    )
+    calls: list[str] = []
+    original = disk_cache.resolve_stored_path
+
+    def _counting(stored_path, cache_dir, roots):
+        calls.append(stored_path)
+        return original(stored_path, cache_dir, roots)
+
+    monkeypatch.setattr(disk_cache, "resolve_stored_path", _counting)
+
+    stored = "normal\\uuid-memo.png"
+    missing = cache._resolve_path(stored)
+    assert not missing.exists()
+    expected = cache.cache_dir / "normal" / "uuid-memo.png"
+    expected.write_bytes(b"image")
+
+    assert cache._resolve_path(stored) == expected
+    assert cache._resolve_path(stored) == expected
+    assert calls == [stored, stored]
+
+
+def test_file_exists_remembers_files_seen_on_disk(tmp_path, monkeypatch):
+    """Repeat lookups of a known file skip the stat; misses are re-checked."""
+    from services.image_service import disk_cache
+
+    cache = card_images.CardImageCache(
+        cache_dir=tmp_path / "cache", db_path=tmp_path / "cache" / "images.db"
+    )
+    image = cache.cache_dir / "normal" / "uuid-seen.jpg"
+    probes: list[str] = []
+    real_exists = disk_cache.os.path.exists
+
+    def _counting_exists(path):
+        probes.append(path)
+        return real_exists(path)
+
+    monkeypatch.setattr(disk_cache.os.path, "exists", _counting_exists)
+
+    assert cache._file_exists(image) is False
+    image.write_bytes(b"image")
+    assert cache._file_exists(image) is True
+    assert cache._file_exists(image) is True
+    assert probes == [str(image), str(image)]
+
+
+def test_add_image_marks_freshly_written_file_as_existing(tmp_path, monkeypatch):
+    """A file add_image records as just written is known to exist without a stat."""
+    from services.image_service import disk_cache
+
+    cache = card_images.CardImageCache(
+        cache_dir=tmp_path / "cache", db_path=tmp_path / "cache" / "images.db"
+    )
+    image = cache.cache_dir / "normal" / "uuid-added.jpg"
+    image.write_bytes(b"image")
+    cache.add_image(
+        uuid="uuid-added",
+        name="Added Card",
+        set_code="SET",
+        collector_number="1",
+        image_size="normal",
+        file_path=image,
+        on_disk=True,
+    )
+    probes: list[str] = []
+    real_exists = disk_cache.os.path.exists
+
+    def _counting_exists(path):
+        probes.append(path)
+        return real_exists(path)
+
+    monkeypatch.setattr(disk_cache.os.path, "exists", _counting_exists)
+
+    assert cache._file_exists(image) is True
+    assert probes == []
+
+
+def test_file_memo_is_bounded_and_can_be_forgotten(tmp_path, monkeypatch):
+    """Known-file and resolved-path memos evict the oldest entries and clear on demand."""
+    from services.image_service import disk_cache
+
+    monkeypatch.setattr(disk_cache, "_PATH_MEMO_LIMIT", 2)
+    cache = card_images.CardImageCache(
+        cache_dir=tmp_path / "cache", db_path=tmp_path / "cache" / "images.db"
+    )
+    images = []
+    for i in range(3):
+        image = cache.cache_dir / "normal" / f"uuid-{i}.jpg"
+        image.write_bytes(b"image")
+        images.append(image)
+        assert cache._resolve_path(str(image)) == image
+
+    assert list(cache._existing_files) == [str(images[1]), str(images[2])]
+    assert list(cache._resolved_paths) == [str(images[1]), str(images[2])]
+
+    images[2].unlink()
+    assert cache._file_exists(images[2]) is True  # still trusted from memory
+    cache.forget_file_paths()
+    assert cache._file_exists(images[2]) is False
+    assert not cache._resolved_paths
+
+
+def test_resolve_stored_path_rebases_foreign_drive_paths(tmp_path, monkeypatch):
+    """Windows drive paths skip the relative-root probing and still rebase."""
+    from services.image_service import path_resolver
+
+    cache_dir = tmp_path / "cache"
+    expected = cache_dir / "normal" / "uuid-drive.jpg"
+    expected.parent.mkdir(parents=True)
+    expected.write_bytes(b"image")
+
+    def _no_probe(*_args, **_kwargs):
+        raise AssertionError("drive paths should not be resolved against local roots")
+
+    if path_resolver.os.name != "nt":
+        monkeypatch.setattr(path_resolver, "normalize_path", _no_probe)
+    stored = "C:\\old_project\\cache\\normal\\uuid-drive.jpg"
+
+    assert path_resolver.resolve_stored_path(stored, cache_dir, [tmp_path]) == expected
+    # Absolute local paths that exist short-circuit on the first check.
+    assert path_resolver.resolve_stored_path(str(expected), cache_dir, []) == expected
+
+
 def test_is_bulk_data_outdated_respects_cached_metadata(tmp_path, monkeypatch):
     """Bulk metadata comparison should rely on cached DB entries when present."""
     cache_dir = tmp_path / "card_images"
     bulk_path = cache_dir / "bulk_data.json"
     bulk_path.parent.mkdir(parents=True, exist_ok=True)
     bulk_path.write_text("[]", encoding="utf-8")
+    an_hour_ago = time.time() - 3600
+    os.utime(bulk_path, (an_hour_ago, an_hour_ago))
 
     monkeypatch.setattr(card_images_schemas, "BULK_DATA_CACHE", bulk_path, raising=False)
 
@@ -653,11 +846,38 @@ def _make_downloader(tmp_path, monkeypatch, bulk_contents="[]"):
     bulk_path.parent.mkdir(parents=True, exist_ok=True)
     if bulk_contents is not None:
         bulk_path.write_text(bulk_contents, encoding="utf-8")
+        # Age the file past the "just downloaded" window so the vendor
+        # metadata is actually consulted.
+        an_hour_ago = time.time() - 3600
+        os.utime(bulk_path, (an_hour_ago, an_hour_ago))
     monkeypatch.setattr(card_images_schemas, "BULK_DATA_CACHE", bulk_path, raising=False)
     cache = card_images.CardImageCache(cache_dir=cache_dir, db_path=cache_dir / "images.db")
     return card_images.BulkImageDownloader(cache), bulk_path
 
 
+def test_freshly_downloaded_bulk_data_skips_metadata_fetch(tmp_path, monkeypatch):
+    """A bulk file written moments ago and on record is trusted without HTTP."""
+    downloader, bulk_path = _make_downloader(tmp_path, monkeypatch)
+    os.utime(bulk_path)  # just written
+
+    def _no_fetch():
+        raise AssertionError("metadata should not be fetched for a fresh download")
+
+    monkeypatch.setattr(downloader, "_fetch_bulk_metadata", _no_fetch)
+    with sqlite3.connect(downloader.cache.db_path) as conn:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO bulk_data_meta (id, downloaded_at, total_cards, bulk_data_uri)
+            VALUES (1, ?, ?, ?)
+            """,
+            ("2024-01-01T00:00:00Z", 0, "http://example.com/bulk"),
+        )
+        conn.commit()
+
+    assert downloader.is_bulk_data_outdated() == (False, {})
+    assert downloader.download_bulk_metadata() == (True, "Using cached bulk data")
+
+
 def test_is_bulk_data_outdated_when_cache_file_missing(tmp_path, monkeypatch):
     """No on-disk bulk file => outdated, regardless of vendor metadata."""
     downloader, bulk_path = _make_downloader(tmp_path, monkeypatch, bulk_contents=None)
@@ -767,6 +987,35 @@ def test_lookup_double_faced_alias_rejects_empty_and_combined_names(tmp_path):
         assert cache._lookup_double_faced_alias(conn, "Wear // Tear", "normal") is None
 
 
+def test_double_faced_alias_misses_are_remembered_until_a_split_card_is_added(tmp_path):
+    """A name with no alias rows skips the LIKE queries until a '//' name lands."""
+    cache = card_images.CardImageCache(
+        cache_dir=tmp_path / "cache", db_path=tmp_path / "cache" / "images.db"
+    )
+    statements: list[str] = []
+    conn = sqlite3.connect(cache.db_path)
+    conn.set_trace_callback(statements.append)
+    try:
+        assert cache._lookup_double_faced_alias(conn, "Fire", "normal") is None
+        assert cache._lookup_double_faced_alias(conn, "Fire", "normal") is None
+        assert len(statements) == 1
+
+        image_file = cache.cache_dir / "normal" / "uuid-fireice3.jpg"
+        image_file.write_bytes(b"fake")
+        cache.add_image(
+            uuid="uuid-fireice3",
+            name="Fire // Ice",
+            set_code="APC",
+            collector_number="128",
+            image_size="normal",
+            file_path=image_file,
+        )
+        assert cache._lookup_double_faced_alias(conn, "Fire", "normal") == image_file
+    finally:
+        conn.close()
+        cache.close()
+
+
 # ---------------------------------------------------------------------------
 # Other public CardImageCache lookups
 # ---------------------------------------------------------------------------
@@ -927,6 +1176,7 @@ class _FakeResponse:
     def __init__(self, content: bytes = b"img", status_ok: bool = True):
         self.content = content
         self._ok = status_ok
+        self.closed = False
 
     def raise_for_status(self):
         if not self._ok:
@@ -937,6 +1187,9 @@ class _FakeResponse:
         for i in range(0, len(self.content), chunk_size):
             yield self.content[i : i + chunk_size]
 
+    def close(self):
+        self.closed = True
+
 
 class _FakeSession:
     """Minimal requests.Session stand-in recording GET calls."""
@@ -1022,6 +1275,76 @@ def test_download_face_asset_short_circuits_when_already_cached(tmp_path):
     assert downloader.session.calls == []
 
 
+def test_get_cached_faces_batches_uuid_lookups(tmp_path, monkeypatch):
+    """Restricting to given UUIDs queries them in IN batches and skips the rest."""
+    from services.image_service import disk_cache
+
+    monkeypatch.setattr(disk_cache, "_SQLITE_IN_BATCH", 2)
+    cache = card_images.CardImageCache(
+        cache_dir=tmp_path / "cache", db_path=tmp_path / "cache" / "images.db"
+    )
+    paths = {}
+    for uuid in ("u1", "u2", "u3", "u4"):
+        paths[uuid] = cache.cache_dir / "normal" / f"{uuid}.jpg"
+        paths[uuid].write_bytes(b"img")
+        cache.add_image(
+            uuid=uuid,
+            name=f"Card {uuid}",
+            set_code="set",
+            collector_number="1",
+            image_size="normal",
+            file_path=paths[uuid],
+        )
+
+    cached = cache.get_cached_faces("normal", ["u1", "u3", "u4", "u1", "missing"])
+
+    assert cached == {(uuid, 0): paths[uuid] for uuid in ("u1", "u3", "u4")}
+
+
+def test_download_face_asset_uses_cached_faces_snapshot(tmp_path, monkeypatch):
+    """Bulk runs consult the preloaded snapshot instead of querying per face."""
+    cache = card_images.CardImageCache(
+        cache_dir=tmp_path / "cache", db_path=tmp_path / "cache" / "images.db"
+    )
+    existing = cache.cache_dir / "normal" / "uuid-snap.jpg"
+    existing.write_bytes(b"already")
+    for uuid, file_path in (
+        ("uuid-snap", existing),
+        ("uuid-gone", cache.cache_dir / "normal" / "uuid-gone.jpg"),
+    ):
+        cache.add_image(
+            uuid=uuid,
+            name="Snapshot Card",
+            set_code="set",
+            collector_number="1",
+            image_size="normal",
+            file_path=file_path,
+        )
+
+    cached_faces = cache.get_cached_faces("normal")
+    assert cached_faces == {("uuid-snap", 0): existing}
+
+    def _no_query(*_args, **_kwargs):
+        raise AssertionError("is_cached should not be consulted")
+
+    monkeypatch.setattr(cache, "is_cached", _no_query)
+    downloader = card_images.BulkImageDownloader(cache)
+    downloader.session = _FakeSession()
+
+    success, message, path = downloader._download_face_asset(
+        uuid="uuid-snap",
+        face_index=0,
+        name="Snapshot Card",
+        image_uris={"normal": "http://img/should-not-fetch.jpg"},
+        size="normal",
+        card={"set": "set"},
+        cached_faces=cached_faces,
+    )
+    assert (success, path) == (True, existing)
+    assert "Already cached" in message
+    assert downloader.session.calls == []
+
+
 def test_download_face_asset_falls_back_to_normal_size(tmp_path):
     """When the requested size is missing, the 'normal' image_uri is used."""
     cache = card_images.CardImageCache(
@@ -1071,9 +1394,8 @@ def test_download_face_asset_handles_http_error(tmp_path):
         cache_dir=tmp_path / "cache", db_path=tmp_path / "cache" / "images.db"
     )
     downloader = card_images.BulkImageDownloader(cache)
-    downloader.session = _FakeSession(
-        responses={"http://img/boom.jpg": _FakeResponse(status_ok=False)}
-    )
+    failing = _FakeResponse(status_ok=False)
+    downloader.session = _FakeSession(responses={"http://img/boom.jpg": failing})
 
     success, message, path = downloader._download_face_asset(
         uuid="uuid-err",
@@ -1087,6 +1409,8 @@ def test_download_face_asset_handles_http_error(tmp_path):
     assert "Error" in message
     assert path is None
     assert cache.get_image_by_uuid("uuid-err", "normal") is None
+    # The streamed response must release its pooled connection on failure.
+    assert failing.closed is True
 
 
 def test_download_multi_face_two_image_card_stores_faces_and_combined(tmp_path):
@@ -1117,6 +1441,36 @@ def test_download_multi_face_two_image_card_stores_faces_and_combined(tmp_path):
     assert cache.get_image_path("Front // Back", "normal") == paths[0]
 
 
+def test_download_multi_face_card_fetches_faces_concurrently(tmp_path):
+    """An on-demand DFC requests both faces at once rather than back to back."""
+    cache = card_images.CardImageCache(
+        cache_dir=tmp_path / "cache", db_path=tmp_path / "cache" / "images.db"
+    )
+    both_in_flight = threading.Barrier(2, timeout=5)
+
+    class _BarrierSession(_FakeSession):
+        def get(self, url, **kwargs):
+            both_in_flight.wait()
+            return super().get(url, **kwargs)
+
+    downloader = card_images.BulkImageDownloader(cache)
+    downloader.session = _BarrierSession()
+    card = {
+        "id": "uuid-parallel",
+        "name": "Front // Back",
+        "card_faces": [
+            {"name": "Front", "image_uris": {"normal": "http://img/front.jpg"}},
+            {"name": "Back", "image_uris": {"normal": "http://img/back.jpg"}},
+        ],
+    }
+
+    success, message = downloader._download_single_image(card, "normal")
+
+    assert success is True
+    assert "2 faces" in message
+    assert sorted(downloader.session.calls) == ["http://img/back.jpg", "http://img/front.jpg"]
+
+
 def test_download_single_image_multi_face_split_card_one_physical_image(tmp_path):
     """A split card (faces without image_uris, one top-level image) stores a single asset."""
     cache = card_images.CardImageCache(
@@ -1237,6 +1591,98 @@ def test_download_all_images_skips_already_cached_cards(tmp_path, monkeypatch):
     assert downloader.session.calls == []
 
 
+def test_download_all_images_bounds_in_flight_futures(tmp_path, monkeypatch):
+    """Cards are submitted through a bounded window, not all up front."""
+    import json
+
+    from services.image_service import downloader as downloader_module
+
+    cache_dir = tmp_path / "card_images"
+    bulk_path = cache_dir / "bulk_data.json"
+    bulk_path.parent.mkdir(parents=True, exist_ok=True)
+    bulk_path.write_text(
+        json.dumps(
+            [
+                {"name": f"Card {i}", "id": f"u-{i}", "image_uris": {"normal": f"http://img/{i}"}}
+                for i in range(40)
+            ]
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(card_images_schemas, "BULK_DATA_CACHE", bulk_path)
+    cache = card_images.CardImageCache(cache_dir=cache_dir, db_path=cache_dir / "images.db")
+    downloader = card_images.BulkImageDownloader(cache, max_workers=2)
+    downloader.session = _FakeSession()
+
+    window_sizes: list[int] = []
+    real_wait = downloader_module.wait
+
+    def _recording_wait(futures, **kwargs):
+        window_sizes.append(len(futures))
+        return real_wait(futures, **kwargs)
+
+    monkeypatch.setattr(downloader_module, "wait", _recording_wait)
+
+    result = downloader.download_all_images("normal")
+
+    assert result["downloaded"] == 40
+    assert max(window_sizes) <= 2 * downloader_module._IN_FLIGHT_PER_WORKER
+
+
+def test_downloader_session_retries_gateway_errors(tmp_path):
+    """The pooled HTTPS adapter retries 502/503/504 GETs on warm connections."""
+    cache = card_images.CardImageCache(
+        cache_dir=tmp_path / "cache", db_path=tmp_path / "cache" / "images.db"
+    )
+    downloader = card_images.BulkImageDownloader(cache, max_workers=3)
+
+    adapter = downloader.session.get_adapter("https://cards.scryfall.io/normal/x.jpg")
+    assert adapter._pool_maxsize == 3
+    assert adapter.max_retries.total == 3
+    assert set(adapter.max_retries.status_forcelist) == {502, 503, 504}
+
+
+def test_download_all_images_records_rows_in_batches(tmp_path, monkeypatch):
+    """A bulk run writes its cache rows in batches and flushes the remainder."""
+    import json
+
+    from services.image_service import image_writer
+
+    cache_dir = tmp_path / "card_images"
+    bulk_path = cache_dir / "bulk_data.json"
+    bulk_path.parent.mkdir(parents=True, exist_ok=True)
+    bulk_path.write_text(
+        json.dumps(
+            [
+                {"name": f"Card {i}", "id": f"u-{i}", "image_uris": {"normal": f"http://img/{i}"}}
+                for i in range(7)
+            ]
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(card_images_schemas, "BULK_DATA_CACHE", bulk_path)
+    monkeypatch.setattr(image_writer, "_RECORD_BATCH", 3)
+    cache = card_images.CardImageCache(cache_dir=cache_dir, db_path=cache_dir / "images.db")
+    batches: list[int] = []
+    real_add_images = cache.add_images
+
+    def _recording_add_images(records, **kwargs):
+        records = list(records)
+        batches.append(len(records))
+        return real_add_images(records, **kwargs)
+
+    monkeypatch.setattr(cache, "add_images", _recording_add_images)
+    downloader = card_images.BulkImageDownloader(cache, max_workers=2)
+    downloader.session = _FakeSession()
+
+    result = downloader.download_all_images("normal")
+
+    assert result["downloaded"] == 7
+    assert sorted(batches) == [1, 3, 3]
+    assert downloader._pending_records is None
+    assert len(cache.get_cached_faces("normal")) == 7
+
+
 def test_download_bulk_metadata_streams_and_records_metadata(tmp_path, monkeypatch):
     """A fresh download streams the bulk file to disk and records vendor metadata."""
     downloader, bulk_path = _make_downloader(tmp_path, monkeypatch, bulk_contents=None)
@@ -1458,20 +1904,43 @@ def test_download_all_images_returns_error_dict_on_load_failure(tmp_path, monkey
     cache_dir = tmp_path / "card_images"
     bulk_path = cache_dir / "bulk_data.json"
     bulk_path.parent.mkdir(parents=True, exist_ok=True)
-    bulk_path.write_text("[]", encoding="utf-8")
+    # The bulk file exists, so we pass the existence guard and fail decoding it.
+    bulk_path.write_text("[{corrupt bulk file", encoding="utf-8")
     monkeypatch.setattr(card_images_schemas, "BULK_DATA_CACHE", bulk_path, raising=False)
     cache = card_images.CardImageCache(cache_dir=cache_dir, db_path=cache_dir / "images.db")
     downloader = card_images.BulkImageDownloader(cache)
 
-    def _boom(_path):
-        raise RuntimeError("corrupt bulk file")
-
-    # The bulk file exists, so we pass the existence guard and fail in fast_load.
-    monkeypatch.setattr("utils.json_io.fast_load", _boom)
-
     result = downloader.download_all_images("normal")
     assert result["success"] is False
-    assert "corrupt bulk file" in result["error"]
+    assert "JSON" in result["error"]
+
+
+def test_load_bulk_card_images_reuses_msgpack_projection(tmp_path, monkeypatch):
+    """The bulk JSON is decoded once per file; later loads read the projection."""
+    import os
+
+    from services.image_service import local_resolver
+
+    cache_dir = tmp_path / "card_images"
+    bulk_path = _write_bulk_data(cache_dir, monkeypatch)
+
+    first = local_resolver.load_bulk_card_images(bulk_path)
+    projection = local_resolver.bulk_images_cache_path(bulk_path)
+    assert projection.exists()
+
+    def _no_json(_raw):
+        raise AssertionError("bulk JSON should not be re-decoded")
+
+    monkeypatch.setattr(
+        local_resolver, "_bulk_card_images_decoder", types.SimpleNamespace(decode=_no_json)
+    )
+    assert local_resolver.load_bulk_card_images(bulk_path) == first
+
+    # A newer bulk file invalidates the projection.
+    stat = bulk_path.stat()
+    os.utime(bulk_path, (stat.st_atime, stat.st_mtime + 10))
+    with pytest.raises(AssertionError, match="re-decoded"):
+        local_resolver.load_bulk_card_images(bulk_path)
 
 
 # ---------------------------------------------------------------------------
@@ -1598,3 +2067,135 @@ def test_get_image_path_for_printing_does_not_accent_fold(tmp_path):
     assert cache.get_image_path_for_printing("Lórien Revealed", "LTR", "normal") == accent_file
     # ASCII spelling with the same set must NOT accent-fold at the printing layer.
     assert cache.get_image_path_for_printing("Lorien Revealed", "LTR", "normal") is None
+
+
+def test_cache_uses_one_writer_and_per_thread_readers(tmp_path):
+    """Inserts share one writer; each thread reads through its own read-only connection."""
+    cache = card_images.CardImageCache(
+        cache_dir=tmp_path / "cache", db_path=tmp_path / "cache" / "images.db"
+    )
+    image_file = cache.cache_dir / "normal" / "writer.jpg"
+    image_file.write_bytes(b"fake")
+    try:
+        for face_index in (0, 1):
+            cache.add_image(
+                uuid="uuid-writer",
+                name="Writer Card",
+                set_code="SET",
+                collector_number="001",
+                image_size="normal",
+                file_path=image_file,
+                face_index=face_index,
+            )
+            if face_index == 0:
+                writer = cache._conn
+        assert cache._conn is writer
+
+        # Lookups on this thread reuse one reader, separate from the writer.
+        assert cache.get_image_by_uuid("uuid-writer") == image_file
+        reader = cache._readers[threading.get_ident()]
+        assert cache.get_image_path("Writer Card") == image_file
+        assert cache._readers[threading.get_ident()] is reader
+        assert reader is not writer
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute("DELETE FROM card_images")
+
+        # Another thread gets its own reader and sees the committed rows.
+        seen: list[object] = []
+        worker = threading.Thread(
+            target=lambda: seen.append(cache.get_image_by_uuid("uuid-writer", face_index=1))
+        )
+        worker.start()
+        worker.join()
+        assert seen == [image_file]
+        assert len(cache._readers) == 2
+
+        # Rows are committed, so an independent connection sees both faces.
+        with sqlite3.connect(cache.db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("SELECT COUNT(*) FROM card_images").fetchone()[0] == 2
+    finally:
+        cache.close()
+    assert cache._conn is None
+    assert cache._readers == {}
+
+
+def test_reader_connection_applies_read_tuning_pragmas(tmp_path, monkeypatch):
+    """Reader connections get a larger page cache, memory temp store and mmap."""
+    from pathlib import Path
+
+    from services.image_service import disk_cache
+
+    cache = card_images.CardImageCache(
+        cache_dir=tmp_path / "cache", db_path=tmp_path / "cache" / "images.db"
+    )
+    try:
+        conn = cache._reader_connection()
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -16 * 1024
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+    finally:
+        cache.close()
+
+    wsl = types.SimpleNamespace(release=lambda: "5.15.0-microsoft-standard-WSL2")
+    monkeypatch.setattr(disk_cache, "platform", wsl)
+    assert disk_cache._mmap_supported(Path("/mnt/c/Users/me/images.db")) is False
+    assert disk_cache._mmap_supported(Path("/home/me/images.db")) is True
+
+
+def test_downloaded_at_stamp_is_reused_within_a_second(tmp_path, monkeypatch):
+    """Rows inserted in the same second share one preformatted timestamp."""
+    from services.image_service import disk_cache
+
+    cache = card_images.CardImageCache(
+        cache_dir=tmp_path / "cache", db_path=tmp_path / "cache" / "images.db"
+    )
+    now = [1_700_000_000.2]
+    monkeypatch.setattr(disk_cache, "time", types.SimpleNamespace(time=lambda: now[0]))
+
+    first = cache._downloaded_at_stamp()
+    now[0] = 1_700_000_000.9
+    assert cache._downloaded_at_stamp() is first
+    now[0] = 1_700_000_001.0
+    later = cache._downloaded_at_stamp()
+
+    assert datetime.fromisoformat(first).timestamp() == 1_700_000_000
+    assert datetime.fromisoformat(later).timestamp() == 1_700_000_001
+
+
+def test_fetch_bulk_metadata_decodes_response_body(tmp_path):
+    """The metadata endpoint body is decoded straight from the raw bytes."""
+    cache = card_images.CardImageCache(
+        cache_dir=tmp_path / "cache", db_path=tmp_path / "cache" / "images.db"
+    )
+    downloader = card_images.BulkImageDownloader(cache)
+    body = b'{"download_uri": "https://example.invalid/bulk.json", "size": 12}'
+    downloader.session = _FakeSession(
+        responses={card_images_schemas.BULK_DATA_URL: _FakeResponse(content=body)}
+    )
+
+    metadata = downloader._fetch_bulk_metadata()
+
+    assert metadata == {"download_uri": "https://example.invalid/bulk.json", "size": 12}
+
+
+def test_ensure_directories_only_creates_missing_size_dirs(tmp_path, monkeypatch):
+    """A warm cache directory is listed once; only absent size folders are created."""
+    from pathlib import Path
+
+    cache_dir = tmp_path / "cache"
+    cache = card_images.CardImageCache(cache_dir=cache_dir, db_path=cache_dir / "images.db")
+    cache.close()
+    (cache_dir / "small").rmdir()
+
+    created: list[str] = []
+    real_mkdir = Path.mkdir
+
+    def _recording_mkdir(self, *args, **kwargs):
+        created.append(self.name)
+        return real_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", _recording_mkdir)
+    card_images.CardImageCache(cache_dir=cache_dir, db_path=cache_dir / "images.db").close()
+
+    assert created == ["small"]
+    assert (cache_dir / "small").is_dir()
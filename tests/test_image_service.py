@@ -1,11 +1,15 @@
 """Tests for ImageService business logic."""
 
+import dataclasses
+
 import pytest
+import requests
 
-import services.image_service as image_service
 from services.image_service import CardImageDownloadQueue, CardImageRequest, ImageService
+from services.image_service import download_queue as download_queue_module
 from utils.constants.timing import (
     IMAGE_DOWNLOAD_INITIAL_BACKOFF_SECONDS,
+    IMAGE_DOWNLOAD_MAX_BACKOFF_SECONDS,
     IMAGE_DOWNLOAD_MAX_RETRIES,
     IMAGE_DOWNLOAD_SLOW_THRESHOLD_SECONDS,
 )
@@ -28,6 +32,12 @@ def synchronous_call_after(monkeypatch):
     monkeypatch.setattr(wx, "CallAfter", lambda func, *a, **k: func(*a, **k))
 
 
+@pytest.fixture(autouse=True)
+def deterministic_backoff_jitter(monkeypatch):
+    """Pin the retry jitter factor to 1.0 so backoff waits are exact."""
+    monkeypatch.setattr(download_queue_module.random, "random", lambda: 1.0)
+
+
 @pytest.fixture(autouse=True)
 def reset_not_found_keys():
     """Clear the class-level not-found cache around each test.
@@ -141,45 +151,142 @@ class _FakeDownloader:
         return response
 
 
-def _build_queue(downloader=None, *, on_failed=None, cache=None):
-    queue = CardImageDownloadQueue(cache or _FakeCache(), on_failed=on_failed)
+def _frozen_clock():
+    return 0.0
+
+
+def _build_queue(downloader=None, *, on_failed=None, cache=None, clock=_frozen_clock):
+    queue = CardImageDownloadQueue(cache or _FakeCache(), on_failed=on_failed, clock=clock)
     if downloader is not None:
         queue._downloader = downloader
     return queue
 
 
+_FAKE_REQUEST = CardImageRequest(
+    card_name="Mirrorpool",
+    uuid=None,
+    set_code="aeoe",
+    collector_number=None,
+    size="normal",
+)
+
+
 def _request(**overrides):
-    params = {
-        "card_name": "Mirrorpool",
-        "uuid": None,
-        "set_code": "aeoe",
-        "collector_number": None,
-        "size": "normal",
-    }
-    params.update(overrides)
-    return CardImageRequest(**params)
+    return dataclasses.replace(_FAKE_REQUEST, **overrides) if overrides else _FAKE_REQUEST
 
 
-def test_download_request_retries_with_backoff(monkeypatch):
-    monkeypatch.setattr(image_service.time, "monotonic", lambda: 0.0)
-    downloader = _FakeDownloader([(False, "429 Too Many Requests"), (True, "ok")])
+_TRANSIENT = (False, "429 Too Many Requests")
+
+
+def _http_error(
+    status: int, message: str | None = None, headers: dict[str, str] | None = None
+) -> requests.HTTPError:
+    """Build the ``HTTPError`` requests raises, with its response attached."""
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return requests.HTTPError(message or f"{status} Client Error", response=response)
+
+
+@pytest.mark.parametrize(
+    ("responses", "expected_result", "expected_sleeps"),
+    [
+        pytest.param([_TRANSIENT, (True, "ok")], True, [0.5], id="retries-with-backoff"),
+        pytest.param(
+            [_http_error(429, headers={"Retry-After": "3"}), (True, "ok")],
+            True,
+            [3.0],
+            id="honours-retry-after",
+        ),
+        pytest.param(
+            [_http_error(429, headers={"Retry-After": "86400"}), (True, "ok")],
+            True,
+            [IMAGE_DOWNLOAD_MAX_BACKOFF_SECONDS],
+            id="caps-retry-after",
+        ),
+        pytest.param(
+            # All attempts are transient failures (initial + MAX_RETRIES); the
+            # backoff doubles per retry up to the cap, then gives up cleanly.
+            [_TRANSIENT] * (IMAGE_DOWNLOAD_MAX_RETRIES + 1),
+            False,
+            [
+                min(
+                    IMAGE_DOWNLOAD_MAX_BACKOFF_SECONDS,
+                    IMAGE_DOWNLOAD_INITIAL_BACKOFF_SECONDS * (2**i),
+                )
+                for i in range(IMAGE_DOWNLOAD_MAX_RETRIES)
+            ],
+            id="retries-exhausted",
+        ),
+    ],
+)
+def test_download_request_retry_schedule(monkeypatch, responses, expected_result, expected_sleeps):
+    downloader = _FakeDownloader(responses)
     queue = _build_queue(downloader)
     sleeps = []
-    # Capture backoff durations without actually waiting; the queue now uses
-    # the stop event's wait() so it can be interrupted on shutdown.
+    # Capture backoff durations without actually waiting; the queue uses the
+    # stop event's wait() so it can be interrupted on shutdown.
     monkeypatch.setattr(queue._stop_event, "wait", lambda seconds: sleeps.append(seconds) or False)
+    try:
+        assert queue._download_request(_request()) is expected_result
+    finally:
+        queue.stop()
+
+    assert downloader.calls == len(responses)
+    assert sleeps == expected_sleeps
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        pytest.param(
+            Exception("404 Client Error: Not Found for url: https://api.scryfall.com/cards"),
+            id="404",
+        ),
+        pytest.param((False, "no normal image for Mirrorpool"), id="permanent-marker"),
+    ],
+)
+def test_download_request_permanent_failure_no_retry(monkeypatch, response):
+    failed = []
+    downloader = _FakeDownloader([response])
+    queue = _build_queue(downloader, on_failed=lambda request, msg: failed.append((request, msg)))
+    waits = []
+    # A permanent failure must skip the retry/backoff path entirely. The retry
+    # path waits on the stop event, so prove no backoff occurred by asserting
+    # _stop_event.wait() is never invoked.
+    monkeypatch.setattr(queue._stop_event, "wait", lambda seconds: waits.append(seconds) or False)
+    try:
+        request = _request()
+        assert queue._download_request(request) is False
+        # The not-found key is now recorded, so further enqueues are skipped.
+        assert queue.enqueue(request) is False
+        assert queue.enqueue(_request(size="large")) is False
+        assert queue.enqueue(_request(collector_number="42")) is False
+    finally:
+        queue.stop()
+
+    assert downloader.calls == 1
+    assert waits == []
+    assert len(failed) == 1
+
+
+def test_download_request_throttling_slows_shared_rate_limiter(monkeypatch):
+    downloader = _FakeDownloader([(False, "429 Too Many Requests"), (True, "ok")])
+    queue = _build_queue(downloader)
+    monkeypatch.setattr(queue._stop_event, "wait", lambda seconds: False)
+    rates = []
+    monkeypatch.setattr(queue._rate_limiter, "on_throttled", lambda: rates.append("throttled"))
+    monkeypatch.setattr(queue._rate_limiter, "on_success", lambda: rates.append("success"))
     try:
         assert queue._download_request(_request()) is True
     finally:
         queue.stop()
 
-    assert downloader.calls == 2
-    assert sleeps == [0.5]
+    assert rates == ["throttled", "success"]
 
 
 def test_download_request_stop_event_interrupts_backoff(monkeypatch):
     """Setting the stop event during backoff should abort retries promptly."""
-    monkeypatch.setattr(image_service.time, "monotonic", lambda: 0.0)
     downloader = _FakeDownloader([(False, "429 Too Many Requests"), (True, "ok")])
     queue = _build_queue(downloader)
     waits = []
@@ -216,31 +323,24 @@ def test_download_request_stop_event_skips_first_attempt():
     assert downloader.calls == 0
 
 
-def test_download_request_404_no_retry(monkeypatch):
-    monkeypatch.setattr(image_service.time, "monotonic", lambda: 0.0)
-    failed = []
-    downloader = _FakeDownloader(
-        [Exception("404 Client Error: Not Found for url: https://api.scryfall.com/cards")]
-    )
-    queue = _build_queue(downloader, on_failed=lambda request, msg: failed.append((request, msg)))
-    waits = []
-    # A permanent failure must skip the retry/backoff path entirely. The retry
-    # path waits on the stop event, so prove no backoff occurred by asserting
-    # _stop_event.wait() is never invoked (mirroring the retry tests).
-    monkeypatch.setattr(queue._stop_event, "wait", lambda seconds: waits.append(seconds) or False)
+@pytest.mark.parametrize(
+    ("error", "permanent"),
+    [
+        (_http_error(404, "Client Error"), True),
+        # A status other than 404 is transient even if the text looks final.
+        (_http_error(503, "404 Not Found upstream"), False),
+    ],
+)
+def test_download_request_classifies_http_errors_by_status(monkeypatch, error, permanent):
+    downloader = _FakeDownloader([error, (True, "ok")])
+    queue = _build_queue(downloader)
+    monkeypatch.setattr(queue._stop_event, "wait", lambda seconds: False)
     try:
-        request = _request()
-        assert queue._download_request(request) is False
-        # The not-found key is now recorded, so further enqueues are skipped.
-        assert queue.enqueue(request) is False
-        assert queue.enqueue(_request(size="large")) is False
-        assert queue.enqueue(_request(collector_number="42")) is False
+        assert queue._download_request(_request()) is not permanent
     finally:
         queue.stop()
 
-    assert downloader.calls == 1
-    assert waits == []
-    assert len(failed) == 1
+    assert downloader.calls == (1 if permanent else 2)
 
 
 @pytest.mark.parametrize(
@@ -269,41 +369,27 @@ def test_is_permanent_failure_message_true(message):
         "429 Too Many Requests",
         "Connection reset by peer",
         "404 but the body says ok",  # 404 without "not found" is transient
+        "Error: Card 14042 not found",  # no standalone status code
     ],
 )
 def test_is_permanent_failure_message_false(message):
     assert CardImageDownloadQueue._is_permanent_failure_message(message) is False
 
 
-def test_download_request_permanent_marker_bails_without_retry(monkeypatch):
-    """A non-404 permanent marker should fail immediately without backoff."""
-    monkeypatch.setattr(image_service.time, "monotonic", lambda: 0.0)
-    failed = []
-    downloader = _FakeDownloader([(False, "no normal image for Mirrorpool")])
-    queue = _build_queue(downloader, on_failed=lambda request, msg: failed.append((request, msg)))
-    waits = []
-    monkeypatch.setattr(queue._stop_event, "wait", lambda seconds: waits.append(seconds) or False)
-    try:
-        request = _request()
-        assert queue._download_request(request) is False
-        # The permanent failure was recorded as not-found, blocking re-enqueue.
-        assert queue.enqueue(request) is False
-    finally:
-        queue.stop()
-
-    assert downloader.calls == 1
-    assert waits == []
-    assert len(failed) == 1
-
-
-def test_download_request_slow_success_treated_as_failure(monkeypatch):
+def test_download_request_slow_success_treated_as_failure():
     """A 'success' that is too slow and never landed on disk is rejected."""
-    # monotonic advances past the slow threshold between the two reads.
-    times = iter([0.0, IMAGE_DOWNLOAD_SLOW_THRESHOLD_SECONDS + 1.0])
-    monkeypatch.setattr(image_service.time, "monotonic", lambda: next(times))
+    now = [0.0]
     downloader = _FakeDownloader([(True, "ok")])
+    real_download = downloader.download_card_image_by_name
+
+    def slow_download(*args, **kwargs):
+        # The clock advances past the slow threshold while the download runs.
+        now[0] += IMAGE_DOWNLOAD_SLOW_THRESHOLD_SECONDS + 1.0
+        return real_download(*args, **kwargs)
+
+    downloader.download_card_image_by_name = slow_download
     # _FakeCache reports nothing cached, so the slow success cannot be verified.
-    queue = _build_queue(downloader)
+    queue = _build_queue(downloader, clock=lambda: now[0])
     try:
         assert queue._download_request(_request()) is False
     finally:
@@ -439,11 +525,10 @@ def test_download_request_cached_returns_true_without_downloading():
     assert downloader.calls == 0
 
 
-def test_download_request_success_clears_prior_not_found(monkeypatch):
+def test_download_request_success_clears_prior_not_found():
     """A fresh, fast success removes a stale not-found marker so re-enqueue works."""
-    # Constant monotonic => zero elapsed, so the slow-success guard is skipped
+    # The frozen test clock => zero elapsed, so the slow-success guard is skipped
     # and the success branch (which discards the not-found key) is reached.
-    monkeypatch.setattr(image_service.time, "monotonic", lambda: 0.0)
     # Empty cache: the cached short-circuit is NOT taken, exercising the real
     # download + success path rather than the early return.
     downloader = _FakeDownloader([(True, "ok")])
@@ -460,26 +545,28 @@ def test_download_request_success_clears_prior_not_found(monkeypatch):
     assert downloader.calls == 1
 
 
-def test_download_request_retries_exhausted_returns_false(monkeypatch):
-    """Backoff doubles each attempt and a final failure gives up cleanly."""
-    monkeypatch.setattr(image_service.time, "monotonic", lambda: 0.0)
-    # All attempts are transient failures (initial + IMAGE_DOWNLOAD_MAX_RETRIES).
-    responses = [(False, "429 Too Many Requests")] * (IMAGE_DOWNLOAD_MAX_RETRIES + 1)
-    downloader = _FakeDownloader(responses)
-    queue = _build_queue(downloader)
-    sleeps = []
-    monkeypatch.setattr(queue._stop_event, "wait", lambda seconds: sleeps.append(seconds) or False)
-    try:
-        assert queue._download_request(_request()) is False
-    finally:
-        queue.stop()
+def test_retry_delay_is_capped_and_jittered(monkeypatch):
+    """Backoff never exceeds the cap and jitter only shrinks it to half."""
+    assert CardImageDownloadQueue._retry_delay(20) == IMAGE_DOWNLOAD_MAX_BACKOFF_SECONDS
+    monkeypatch.setattr(download_queue_module.random, "random", lambda: 0.0)
+    assert CardImageDownloadQueue._retry_delay(0) == IMAGE_DOWNLOAD_INITIAL_BACKOFF_SECONDS / 2
 
-    assert downloader.calls == IMAGE_DOWNLOAD_MAX_RETRIES + 1
-    # Backoff doubles between retries: 0.5, 1.0, 2.0, ... for MAX_RETRIES waits.
-    expected = [
-        IMAGE_DOWNLOAD_INITIAL_BACKOFF_SECONDS * (2**i) for i in range(IMAGE_DOWNLOAD_MAX_RETRIES)
-    ]
-    assert sleeps == expected
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        pytest.param(None, None, id="missing"),
+        pytest.param("2", 2.0, id="seconds"),
+        pytest.param("99999", IMAGE_DOWNLOAD_MAX_BACKOFF_SECONDS, id="seconds-capped"),
+        pytest.param(
+            "Fri, 31 Dec 9999 23:59:59 GMT", IMAGE_DOWNLOAD_MAX_BACKOFF_SECONDS, id="date"
+        ),
+        pytest.param("Wed, 21 Oct 2015 07:28:00 GMT", 0.0, id="date-in-past"),
+        pytest.param("soon", None, id="garbage"),
+    ],
+)
+def test_parse_retry_after_header(header, expected):
+    assert CardImageDownloadQueue._parse_retry_after(header) == expected
 
 
 def test_notify_downloaded_fires_only_when_cached():
@@ -513,6 +600,17 @@ def test_request_queue_key_uses_uuid_when_present():
     assert _request(uuid="ABC-123", size="large").queue_key() != with_uuid.queue_key()
 
 
+def test_request_keys_are_precomputed_and_follow_replace():
+    """Cached keys survive dataclasses.replace and do not affect equality."""
+    request = _request(uuid="ABC-123")
+    assert not hasattr(request, "__dict__")
+    assert request.not_found_key() == ("mirrorpool", "aeoe")
+    assert request == _request(uuid="ABC-123")
+
+    resized = dataclasses.replace(request, size="large")
+    assert resized.queue_key() == ("uuid", "abc-123", "large", "")
+
+
 def test_image_service_download_callback_dispatched(image_service_instance):
     """A queued success dispatches the registered download callback via _call_after."""
     service = image_service_instance
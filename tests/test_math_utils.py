@@ -246,6 +246,32 @@ class TestProbabilityBounds:
         total = sum(hypergeometric_probability(pop, k_pop, n, k) for k in range(min(k_pop, n) + 1))
         assert abs(total - 1.0) < 1e-10
 
+    def test_at_least_matches_bucket_sum_when_low_buckets_impossible(self) -> None:
+        """The tail walk must skip buckets ruled out by too few failures."""
+        # 8 of 10 cards are targets, so drawing 5 always yields at least 3.
+        expected = sum(hypergeometric_probability(10, 8, 5, k) for k in range(3, 6))
+        assert hypergeometric_at_least(10, 8, 5, 2) == pytest.approx(expected)
+        assert hypergeometric_at_least(10, 8, 5, 2) == pytest.approx(1.0)
+
+    def test_at_least_one_complement_matches_bucket_sum(self) -> None:
+        """The 1 - P(X = 0) shortcut must agree with summing every bucket."""
+        for pop, k_pop, n in [(60, 4, 7), (40, 17, 9), (10, 8, 5), (60, 0, 7)]:
+            expected = sum(
+                hypergeometric_probability(pop, k_pop, n, x) for x in range(1, min(k_pop, n) + 1)
+            )
+            assert hypergeometric_at_least(pop, k_pop, n, 1) == pytest.approx(expected, abs=1e-12)
+
+    def test_matches_exact_big_int_combinatorics(self) -> None:
+        """The log-space evaluation must agree with exact math.comb ratios."""
+        import math
+
+        for pop, k_pop, n in [(60, 4, 7), (40, 17, 9), (100, 20, 15), (250, 60, 40)]:
+            for x in range(min(k_pop, n) + 1):
+                exact = math.comb(k_pop, x) * math.comb(pop - k_pop, n - x) / math.comb(pop, n)
+                assert hypergeometric_probability(pop, k_pop, n, x) == pytest.approx(
+                    exact, rel=1e-9
+                )
+
 
 class TestHypergeometricExactly:
     """Tests for the lenient hypergeometric_exactly helper."""
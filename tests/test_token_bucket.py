@@ -0,0 +1,53 @@
+"""Tests for the download queue's token-bucket rate limiter."""
+
+from services.image_service.rate_limiter import TokenBucket
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _bucket(clock: _Clock, *, rate: float = 2.0, burst: float = 2.0) -> TokenBucket:
+    return TokenBucket(rate, burst, min_rate=0.5, recovery_step=0.5, clock=clock)
+
+
+def test_reserve_admits_burst_then_schedules_waits():
+    clock = _Clock()
+    bucket = _bucket(clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    # Bucket empty: each further reservation queues behind the previous one.
+    assert bucket.reserve() == 0.5
+    assert bucket.reserve() == 1.0
+
+
+def test_reserve_refills_with_elapsed_time_up_to_burst():
+    clock = _Clock()
+    bucket = _bucket(clock)
+    bucket.reserve()
+    bucket.reserve()
+
+    clock.now = 10.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.5
+
+
+def test_throttle_halves_rate_and_success_recovers_to_ceiling():
+    bucket = _bucket(_Clock(), rate=4.0)
+
+    bucket.on_throttled()
+    assert bucket.rate == 2.0
+    bucket.on_throttled()
+    bucket.on_throttled()
+    bucket.on_throttled()
+    assert bucket.rate == 0.5  # floor
+
+    for _ in range(20):
+        bucket.on_success()
+    assert bucket.rate == 4.0
@@ -558,12 +558,14 @@ def test_on_save_clicked_round_trip(
 
         frame.controller.save_deck = fake_save_deck  # type: ignore[assignment]
 
-        with patch("wx.TextEntryDialog") as dialog_cls, patch("wx.MessageBox"):
+        with patch("wx.TextEntryDialog") as dialog_cls, patch("wx.MessageBox") as message_box:
             dialog = dialog_cls.return_value
             dialog.ShowModal.return_value = wx.ID_OK
             dialog.GetValue.return_value = "My Saved Deck"
             frame.on_save_clicked(None)
 
+        # A successful save is reported on the status bar, not in a modal.
+        assert not message_box.called
         assert len(save_calls) == 1
         assert save_calls[0]["deck_name"] == "My Saved Deck"
         assert save_calls[0]["deck_content"].strip()
@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
+import mmap
 import os
 import tempfile
 import threading
 import time
 from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import msgspec.json
+import msgspec.msgpack
 
-_lock_registry: dict[Path, threading.RLock] = {}
-_lock_registry_lock = threading.Lock()
+# Paths map onto a fixed pool of reentrant locks instead of a per-path registry
+# that grows for the life of the process. Two paths may share a stripe, which
+# only costs some spurious serialization between unrelated writers.
+_LOCK_STRIPES = 64
+_stripe_locks = tuple(threading.RLock() for _ in range(_LOCK_STRIPES))
 
 # Windows briefly holds a handle on the destination (antivirus, Search
 # indexer, or a concurrent reader) which makes os.replace fail with
@@ -23,8 +29,15 @@ _lock_registry_lock = threading.Lock()
 _REPLACE_RETRIES = 5
 _REPLACE_BACKOFF = 0.05
 
+# madvise is POSIX-only; Windows maps the file without the hint.
+_MADV_SEQUENTIAL: int | None = getattr(mmap, "MADV_SEQUENTIAL", None)
 
-def _replace_with_retry(src: Path, dst: Path) -> None:
+# Re-usable encoder (avoids rebuilding encoder state on every JSON write).
+_json_encoder = msgspec.json.Encoder()
+_msgpack_encoder = msgspec.msgpack.Encoder()
+
+
+def _replace_with_retry(src: str | Path, dst: Path) -> None:
     for attempt in range(_REPLACE_RETRIES):
         try:
             os.replace(src, dst)
@@ -35,14 +48,20 @@ def _replace_with_retry(src: Path, dst: Path) -> None:
             time.sleep(_REPLACE_BACKOFF * (attempt + 1))
 
 
+@lru_cache(maxsize=2048)
+def _normalize_absolute(raw: str) -> str:
+    return os.path.normcase(os.path.normpath(raw))
+
+
 def _get_path_lock(path: Path) -> threading.RLock:
-    resolved = path.resolve()
-    with _lock_registry_lock:
-        lock = _lock_registry.get(resolved)
-        if lock is None:
-            lock = threading.RLock()
-            _lock_registry[resolved] = lock
-        return lock
+    raw = os.fspath(path)
+    # Absolute spellings are memoized; relative ones depend on the current
+    # working directory, so they are normalized afresh each time.
+    if os.path.isabs(raw):
+        normalized = _normalize_absolute(raw)
+    else:
+        normalized = os.path.normcase(os.path.abspath(raw))
+    return _stripe_locks[hash(normalized) & (_LOCK_STRIPES - 1)]
 
 
 @contextmanager
@@ -55,6 +74,26 @@ def locked_path(path: Path) -> Iterator[None]:
         lock.release()
 
 
+@contextmanager
+def mapped_read(path: Path) -> Iterator[bytes | mmap.mmap]:
+    """Yield the contents of *path* as a read-only memory map, under its lock.
+
+    Decoders read straight from the page cache instead of a private copy of
+    the file, which matters for the multi-hundred-megabyte bulk JSON. The map
+    is closed on exit, so decode inside the ``with`` block. An empty file
+    yields ``b""`` since a zero-length file cannot be mapped.
+    """
+    with locked_path(path), open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if _MADV_SEQUENTIAL is not None:
+                # Decoders scan front to back; let the kernel read ahead.
+                mapped.madvise(_MADV_SEQUENTIAL)
+            yield mapped
+
+
 def _fsync_dir(directory: Path) -> None:
     try:
         fd = os.open(directory, os.O_RDONLY)
@@ -68,49 +107,55 @@ def _fsync_dir(directory: Path) -> None:
         os.close(fd)
 
 
-def atomic_write_bytes(path: Path, data: bytes) -> None:
+@contextmanager
+def _atomic_open(path: Path, durable: bool = True) -> Iterator[BinaryIO]:
+    """Yield a binary handle on a temp file that atomically replaces *path*.
+
+    The temp file lives next to *path* so the final ``os.replace`` stays on one
+    filesystem; unless *durable* is false it is fsynced before the swap (and the
+    directory after it). The temp file is removed if the body raises.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
     with locked_path(path):
-        fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
-        tmp_file = Path(tmp_path)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{path.name}.", suffix=".tmp", dir=os.fspath(path.parent)
+        )
+        replaced = False
         try:
             with os.fdopen(fd, "wb") as fh:
-                fh.write(data)
-                fh.flush()
-                os.fsync(fh.fileno())
-            _replace_with_retry(tmp_file, path)
-            _fsync_dir(path.parent)
+                yield fh
+                if durable:
+                    fh.flush()
+                    os.fsync(fh.fileno())
+            _replace_with_retry(tmp_path, path)
+            replaced = True
+            if durable:
+                _fsync_dir(path.parent)
         finally:
-            if tmp_file.exists():
+            # After a successful replace the temp name is gone; only a failed
+            # write needs the cleanup unlink.
+            if not replaced:
                 try:
-                    tmp_file.unlink()
+                    os.unlink(tmp_path)
                 except OSError:
                     pass
 
 
-def atomic_write_stream(path: Path, chunks: Iterable[bytes]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with locked_path(path):
-        fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
-        tmp_file = Path(tmp_path)
-        try:
-            with os.fdopen(fd, "wb") as fh:
-                for chunk in chunks:
-                    fh.write(chunk)
-                fh.flush()
-                os.fsync(fh.fileno())
-            _replace_with_retry(tmp_file, path)
-            _fsync_dir(path.parent)
-        finally:
-            if tmp_file.exists():
-                try:
-                    tmp_file.unlink()
-                except OSError:
-                    pass
+def atomic_write_bytes(path: Path, data: bytes, *, durable: bool = True) -> None:
+    with _atomic_open(path, durable) as fh:
+        fh.write(data)
 
 
-def atomic_write_text(path: Path, text: str, *, encoding: str = "utf-8") -> None:
-    atomic_write_bytes(path, text.encode(encoding))
+def atomic_write_stream(path: Path, chunks: Iterable[bytes], *, durable: bool = True) -> None:
+    with _atomic_open(path, durable) as fh:
+        for chunk in chunks:
+            fh.write(chunk)
+
+
+def atomic_write_text(
+    path: Path, text: str, *, encoding: str = "utf-8", durable: bool = True
+) -> None:
+    atomic_write_bytes(path, text.encode(encoding), durable=durable)
 
 
 def atomic_write_json(
@@ -120,14 +165,24 @@ def atomic_write_json(
     indent: int | None = 2,
     ensure_ascii: bool = False,
     separators: tuple[str, str] | None = None,
+    durable: bool = True,
 ) -> None:
     # msgspec.json.encode always produces compact UTF-8 bytes (no ASCII escaping).
     # The ``ensure_ascii`` parameter is accepted for API compatibility but ignored
     # because msgspec always uses UTF-8 encoding (never escapes non-ASCII chars).
-    raw: bytes = msgspec.json.encode(payload)
+    raw: bytes = _json_encoder.encode(payload)
     if indent is not None:
         raw = msgspec.json.format(raw, indent=indent)
     # When callers explicitly request compact output via ``separators``,
     # ``indent`` is typically None so the branch above is skipped and we
-    # already have compact bytes – nothing more to do.
-    atomic_write_bytes(path, raw)
+    # already have compact bytes – nothing more to do. The encoded buffer goes
+    # straight into the temp file; no intermediate str or copy is made.
+    with _atomic_open(path, durable) as fh:
+        fh.write(raw)
+
+
+def atomic_write_msgpack(path: Path, payload: Any, *, durable: bool = True) -> None:
+    """Atomically write *payload* as MessagePack, for machine-only caches."""
+    raw: bytes = _msgpack_encoder.encode(payload)
+    with _atomic_open(path, durable) as fh:
+        fh.write(raw)
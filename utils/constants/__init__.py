@@ -121,6 +121,7 @@ from utils.constants.timing import (
     BULK_CACHE_MAX_AGE_DAYS,
     BULK_CACHE_MIN_AGE_DAYS,
     BULK_DATA_CACHE_FRESHNESS_SECONDS,
+    BULK_DATA_METADATA_RECHECK_SECONDS,
     COLLECTION_BRIDGE_TIMEOUT_SECONDS,
     COLLECTION_CACHE_MAX_AGE_SECONDS,
     DEFAULT_BULK_DATA_MAX_AGE_DAYS,
@@ -149,6 +150,7 @@ from utils.constants.timing import (
     SCRYFALL_BULK_STREAM_TIMEOUT_SECONDS,
     SCRYFALL_DOWNLOAD_CHUNK_SIZE,
     SCRYFALL_DOWNLOAD_PROGRESS_INTERVAL,
+    SCRYFALL_IMAGE_CHUNK_SIZE,
     SCRYFALL_MAX_DOWNLOAD_WORKERS,
     SCRYFALL_REQUEST_TIMEOUT_SECONDS,
     SQLITE_BUSY_TIMEOUT_MS,
@@ -464,6 +466,7 @@ __all__ = [
     "OPPONENT_TRACKER_REQUEST_TIMEOUT_SECONDS",
     "BUILDER_SEARCH_DEBOUNCE_MS",
     "BULK_DATA_CACHE_FRESHNESS_SECONDS",
+    "BULK_DATA_METADATA_RECHECK_SECONDS",
     "BRIDGE_PROCESS_TERMINATE_TIMEOUT_SECONDS",
     "COLLECTION_CACHE_MAX_AGE_SECONDS",
     "DEFAULT_BULK_DATA_MAX_AGE_DAYS",
@@ -473,6 +476,7 @@ __all__ = [
     "SCRYFALL_BULK_STREAM_TIMEOUT_SECONDS",
     "SCRYFALL_DOWNLOAD_CHUNK_SIZE",
     "SCRYFALL_DOWNLOAD_PROGRESS_INTERVAL",
+    "SCRYFALL_IMAGE_CHUNK_SIZE",
     "SCRYFALL_MAX_DOWNLOAD_WORKERS",
     "SCRYFALL_REQUEST_TIMEOUT_SECONDS",
     "BYTES_PER_MB",
@@ -12,6 +12,8 @@ METAGAME_CACHE_TTL_SECONDS = ONE_HOUR_SECONDS
 # Card image bulk data refresh thresholds
 DEFAULT_BULK_DATA_MAX_AGE_DAYS = 30
 BULK_DATA_CACHE_FRESHNESS_SECONDS = DEFAULT_BULK_DATA_MAX_AGE_DAYS * ONE_DAY_SECONDS
+# A bulk file written this recently is trusted without asking Scryfall again.
+BULK_DATA_METADATA_RECHECK_SECONDS = 5 * 60
 
 BULK_CACHE_MIN_AGE_DAYS = 1
 BULK_CACHE_MAX_AGE_DAYS = 365
@@ -87,7 +89,8 @@ BUILDER_SEARCH_DEBOUNCE_MS = 300  # milliseconds to wait after last filter chang
 SCRYFALL_REQUEST_TIMEOUT_SECONDS = 30  # timeout for individual Scryfall API/image requests
 SCRYFALL_BULK_STREAM_TIMEOUT_SECONDS = 120  # timeout for streaming the bulk data download
 SCRYFALL_MAX_DOWNLOAD_WORKERS = 10  # concurrent image download threads
-SCRYFALL_DOWNLOAD_CHUNK_SIZE = 8192  # byte chunk size when streaming downloaded images
+SCRYFALL_DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # chunk size when streaming the ~500MB bulk data file
+SCRYFALL_IMAGE_CHUNK_SIZE = 128 * 1024  # chunk size for streaming card images (one read per image)
 SCRYFALL_DOWNLOAD_PROGRESS_INTERVAL = 100  # invoke progress callback every N completed cards
 
 # Startup cache warm-up — lazy background pre-fetch of decklists and card images.
@@ -128,6 +131,10 @@ IMAGE_DOWNLOAD_QUEUE_IDLE_WAIT_SECONDS = (
 )
 IMAGE_DOWNLOAD_MAX_RETRIES = 5  # max retry attempts before giving up on a card image download
 IMAGE_DOWNLOAD_INITIAL_BACKOFF_SECONDS = 0.5  # initial backoff delay before first retry
+IMAGE_DOWNLOAD_MAX_BACKOFF_SECONDS = 8.0  # cap on the exponential backoff between retries
 IMAGE_DOWNLOAD_SLOW_THRESHOLD_SECONDS = (
     1.5  # elapsed time above which a "successful" download is treated as failed
 )
+IMAGE_DOWNLOAD_RATE_PER_SECOND = 10.0  # Scryfall's requested ceiling for API requests
+IMAGE_DOWNLOAD_MIN_RATE_PER_SECOND = 1.0  # floor the rate limiter backs off to on 429s
+IMAGE_DOWNLOAD_RATE_RECOVERY_STEP = 0.5  # requests/second regained per successful download
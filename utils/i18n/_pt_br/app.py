@@ -7,7 +7,7 @@ MESSAGES: dict[str, str] = {
     "app.status.restoring_deck": "Carregando banco de dados de cartas para restaurar o deck salvo...",
     "app.status.loading_deck": "Carregando deck {name}…",
     "app.status.deck_copied": "Deck copiado para a área de transferência.",
-    "app.status.deck_saved": "Deck salvo com sucesso.",
+    "app.status.deck_saved": "Deck salvo em {path}.",
     "app.status.archetypes_error": "Erro: {error}",
     "app.status.decks_error": "Erro ao carregar decks: {error}",
     "app.status.deck_download_error": "Falha no download do deck: {error}",
@@ -6,6 +6,18 @@ card draws in Magic: The Gathering using the hypergeometric distribution.
 """
 
 import math
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def _log_factorial(n: int) -> float:
+    """Return ln(n!), memoized since deck math reuses a small set of sizes."""
+    return math.lgamma(n + 1)
+
+
+def _log_comb(n: int, k: int) -> float:
+    """Return ln(C(n, k)) for 0 <= k <= n."""
+    return _log_factorial(n) - _log_factorial(k) - _log_factorial(n - k)
 
 
 def hypergeometric_probability(
@@ -60,21 +72,14 @@ def hypergeometric_probability(
         # Impossible scenario - not enough non-target cards available
         return 0.0
 
-    # Calculate probability using combinations
-    # P(X = k) = [C(K, k) × C(N-K, n-k)] / C(N, n)
-    try:
-        numerator = math.comb(successes_in_pop, successes_in_sample) * math.comb(
-            failures_in_pop, failures_in_sample
-        )
-        denominator = math.comb(population, sample_size)
-
-        if denominator == 0:
-            return 0.0
-
-        return numerator / denominator
-
-    except (ValueError, OverflowError) as e:
-        raise ValueError(f"Error calculating probability: {e}") from e
+    # P(X = k) = [C(K, k) × C(N-K, n-k)] / C(N, n), evaluated in log space so
+    # each call is a handful of cached float lookups instead of big-int products.
+    log_probability = (
+        _log_comb(successes_in_pop, successes_in_sample)
+        + _log_comb(failures_in_pop, failures_in_sample)
+        - _log_comb(population, sample_size)
+    )
+    return min(1.0, math.exp(log_probability))
 
 
 def hypergeometric_exactly(
@@ -106,7 +111,8 @@ def hypergeometric_at_least(
     Calculate the probability of drawing at least a minimum number of target cards.
 
     Computes P(X >= min_successes) by summing probabilities from min_successes
-    to the maximum possible number of target cards that could be drawn.
+    to the maximum possible number of target cards that could be drawn, stepping
+    between buckets with the PMF ratio rather than re-evaluating each term.
 
     Example:
         >>> # Probability of drawing at least 1 Lightning Bolt in opening hand
@@ -129,11 +135,31 @@ def hypergeometric_at_least(
     if min_successes > max_successes:
         return 0.0
 
-    # Sum probabilities from min_successes to max_successes
-    total_probability = 0.0
-    for k in range(min_successes, max_successes + 1):
-        total_probability += hypergeometric_probability(
-            population, successes_in_pop, sample_size, k
-        )
+    # "At least one" is by far the most common query (opening hands, turn-N
+    # draws); its complement is a single bucket, so skip the tail walk.
+    if min_successes == 1:
+        miss = hypergeometric_probability(population, successes_in_pop, sample_size, 0)
+        return max(0.0, 1.0 - miss)
+
+    # Evaluate the first term once (this also validates the arguments), then
+    # walk the tail with the PMF ratio
+    #   P(k + 1) / P(k) = (K - k)(n - k) / ((k + 1)(N - K - n + k + 1))
+    # so each further bucket is one multiply instead of a full PMF evaluation.
+    term = hypergeometric_probability(population, successes_in_pop, sample_size, min_successes)
+    failures_in_pop = population - successes_in_pop
+    # Buckets below n - (N - K) are impossible (P = 0) and would zero the
+    # recurrence, so start from the first feasible bucket.
+    k = max(min_successes, sample_size - failures_in_pop)
+    if k > min_successes:
+        term = hypergeometric_probability(population, successes_in_pop, sample_size, k)
 
-    return total_probability
+    total_probability = 0.0
+    while True:
+        total_probability += term
+        if k >= max_successes:
+            break
+        term *= (successes_in_pop - k) * (sample_size - k)
+        term /= (k + 1) * (failures_in_pop - sample_size + k + 1)
+        k += 1
+
+    return min(1.0, total_probability)
@@ -140,7 +140,7 @@ class AppFrame(
         self._guide_record: dict[str, Any] | None = None
         self._guide_record_bar: wx.MiniFrame | None = None
 
-        self._save_timer: wx.Timer | None = None
+        self._save_call_later: wx.CallLater | None = None
         self._filter_debounce_timer: wx.Timer | None = None
         self.mana_icons = ManaIconFactory()
         self.tracker_window: MTGOpponentDeckSpy | None = None
@@ -209,7 +209,7 @@ class AppFrameHandlersMixin(_Base):
         )
 
     def _restore_session_state(self) -> None:
-        state = self.controller.session_manager.restore_session_state(self.controller.zone_cards)
+        state = self.controller.get_or_load_session_state()
         if should_show_tutorial(
             tutorial_shown=self.controller.session_manager.is_tutorial_shown(),
             automation_enabled=is_automation_enabled(),
@@ -251,7 +251,7 @@ class AppFrameHandlersMixin(_Base):
         )
 
     def _apply_window_preferences(self) -> None:
-        state = self.controller.session_manager.restore_session_state(self.controller.zone_cards)
+        state = self.controller.get_or_load_session_state()
 
         # Restore the collapsed/expanded state of the side panels before sizing,
         # so the recomputed minimum reflects what is actually shown.
@@ -362,15 +362,10 @@ class AppFrameHandlersMixin(_Base):
         self._apply_min_size()
 
     def _schedule_settings_save(self) -> None:
-        if self._save_timer is None:
-            self._save_timer = wx.Timer(self)
-            self.Bind(wx.EVT_TIMER, self._flush_pending_settings, self._save_timer)
-        if self._save_timer.IsRunning():
-            self._save_timer.Stop()
-        self._save_timer.StartOnce(600)
-
-    def _flush_pending_settings(self, _event: wx.TimerEvent) -> None:
-        self._save_window_settings()
+        if self._save_call_later is None:
+            self._save_call_later = wx.CallLater(600, self._save_window_settings)
+        else:
+            self._save_call_later.Restart(600)
 
     def _schedule_filter_debounce(self) -> None:
         if self._filter_debounce_timer is None:
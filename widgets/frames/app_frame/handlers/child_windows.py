@@ -133,8 +133,8 @@ class ChildWindowHandlers(_Base):
         event.Skip()
 
     def on_close(self: AppFrame, event: wx.CloseEvent) -> None:
-        if self._save_timer and self._save_timer.IsRunning():
-            self._save_timer.Stop()
+        if self._save_call_later and self._save_call_later.IsRunning():
+            self._save_call_later.Stop()
         if self._filter_debounce_timer and self._filter_debounce_timer.IsRunning():
             self._filter_debounce_timer.Stop()
         self._save_window_settings()
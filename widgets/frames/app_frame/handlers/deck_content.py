@@ -133,11 +133,10 @@ class DeckContentHandlers(_Base):
             wx.MessageBox(f"Failed to write deck file:\n{exc}", "Save Deck", wx.OK | wx.ICON_ERROR)
             return
 
-        message = f"Deck saved to {file_path}"
-        if deck_id:
-            message += f"\nDatabase ID: {deck_id}"
-        wx.MessageBox(message, "Deck Saved", wx.OK | wx.ICON_INFORMATION)
-        self._set_status("app.status.deck_saved")
+        # Success is reported on the status bar rather than in a modal so
+        # repeated saves never stall on an OK click; errors stay modal.
+        logger.info(f"Deck saved to {file_path} (database id: {deck_id})")
+        self._set_status("app.status.deck_saved", path=file_path)
 
     def _on_deck_download_error(self: AppFrame, error: Exception) -> None:
         self.copy_button.Disable()
@@ -83,7 +83,7 @@ class AppFrameProto(Protocol):
     daily_average_button: wx.Button
 
     # Timers and pending state
-    _save_timer: wx.Timer | None
+    _save_call_later: wx.CallLater | None
     _filter_debounce_timer: wx.Timer | None
     _inspector_hover_timer: wx.Timer | None
     _pending_hover: tuple[str, dict[str, Any]] | None
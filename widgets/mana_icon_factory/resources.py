@@ -4,6 +4,9 @@ from pathlib import Path
 import wx
 from loguru import logger
 
+_COLOR_RE = re.compile(r"--ms-mana-([a-z0-9-]+):\s*#([0-9a-fA-F]{6})")
+_GLYPH_BLOCK_RE = re.compile(r'([^{}]+)\{[^{}]*?content:\s*"([^"]+)"[^{}]*\}')
+
 
 class ManaIconResources:
     _FONT_LOADED = False
@@ -40,22 +43,13 @@ class ManaIconResources:
         if not css_path.exists():
             return glyphs, {k: tuple(v) for k, v in fallback_colors.items()}
         css_text = css_path.read_text(encoding="utf-8")
-        color_re = re.compile(r"--ms-mana-([a-z0-9-]+):\s*#([0-9a-fA-F]{6})")
-        for match in color_re.finditer(css_text):
+        for match in _COLOR_RE.finditer(css_text):
             key = match.group(1).lower()
             hex_value = match.group(2)
             colors[key] = tuple(int(hex_value[i : i + 2], 16) for i in (0, 2, 4))
-        for block in css_text.split("}"):
-            if "content" not in block or "::" not in block:
-                continue
-            parts = block.split("{", 1)
-            if len(parts) != 2:
-                continue
-            selectors, body = parts
-            content_match = re.search(r'content:\s*"([^"]+)"', body)
-            if not content_match:
+        for selectors, glyph_char in _GLYPH_BLOCK_RE.findall(css_text):
+            if "::" not in selectors:
                 continue
-            glyph_char = content_match.group(1)
             for raw_selector in selectors.split(","):
                 raw_selector = raw_selector.strip()
                 if not raw_selector.startswith(".ms-"):